@@ -1,10 +1,15 @@
+import atexit
+import gc
 import json
 import logging
+import logging.handlers
 import math
+import os
 import queue
 import sys
+import threading
 import time
-from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +17,14 @@ import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox, colorchooser
 
+try:
+    from scipy.signal import lfilter  # type: ignore[import-not-found]
+
+    SCIPY_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    lfilter = None  # type: ignore[assignment]
+    SCIPY_AVAILABLE = False
+
 try:
     import torch
     import torch.nn as nn
@@ -21,6 +34,14 @@ except ImportError:
     torch = None
     nn = None
 
+try:
+    import onnxruntime as ort  # type: ignore[import-not-found]
+
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    ort = None  # type: ignore[assignment]
+    ONNXRUNTIME_AVAILABLE = False
+
 try:
     import serial  # type: ignore[import-not-found]
 
@@ -37,6 +58,22 @@ if SERIAL_AVAILABLE:
 else:
     list_ports = None  # type: ignore[assignment]
 
+try:
+    import numpy_rms  # type: ignore[import-not-found]
+
+    NUMPY_RMS_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    numpy_rms = None  # type: ignore[assignment]
+    NUMPY_RMS_AVAILABLE = False
+
+try:
+    from numba import njit  # type: ignore[import-not-found]
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore[assignment]
+    NUMBA_AVAILABLE = False
+
 try:
     import pyaudiowpatch as pyaudio
 except ImportError:  # pragma: no cover
@@ -44,23 +81,175 @@ except ImportError:  # pragma: no cover
 
 
 INT16_MAX = 32768.0
+# float32 so the int16 -> float scaling never falls back to a float64 multiply.
+INV_INT16_MAX_F32 = np.float32(1.0 / INT16_MAX)
+# Frame start marker. Payload values are clamped to SERIAL_MAX_VALUE and the count byte is 1 or
+# 2, so the sync byte never appears inside a frame and a receiver joining mid-stream realigns
+# on the next one.
+SERIAL_SYNC_BYTE = 0xFF
+SERIAL_MAX_VALUE = 0xFE
+METER_HEIGHT = 12
+# Quiet period after the last <Configure> event before a window lays itself out again.
+RESIZE_DEBOUNCE_MS = 80
 AUDIO_FORMAT = getattr(pyaudio, "paInt16", 8)
 
 
+def _rms(x: np.ndarray) -> np.ndarray:
+    """RMS over the last axis of a 1D or 2D block (one value per row)."""
+    if (
+        NUMPY_RMS_AVAILABLE
+        and x.dtype == np.float32
+        and x.ndim in (1, 2)
+        and x.shape[-1] > 0
+        and x.flags["C_CONTIGUOUS"]
+    ):
+        return numpy_rms.rms(x).reshape(x.shape[:-1])
+    # Sum of squares in one einsum pass, without materialising x**2.
+    ssq = np.einsum("...i,...i->...", x, x)
+    return np.sqrt(ssq / max(x.shape[-1], 1))
+
+
+def _pow2_blocksize(samplerate: int, fps: int, min_frames: int = 128) -> int:
+    """Smallest power of two that covers one ``fps`` period (44.1/48 kHz at 120 FPS -> 512)."""
+    frames = max(min_frames, int(math.ceil(samplerate / max(1, fps))))
+    return 1 << (frames - 1).bit_length()
+
+
+def _aligned_empty(shape: tuple[int, ...], dtype=np.float32, align: int = 64) -> np.ndarray:
+    """np.empty whose data pointer sits on an ``align``-byte boundary (cache line / AVX-512)."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % align
+    return raw[offset : offset + nbytes].view(dtype).reshape(shape)
+
+
+if NUMBA_AVAILABLE:
+
+    # nogil: the compiled call releases the GIL, so the Tk thread keeps running while the
+    # PortAudio thread is inside the kernel and neither waits on the other.
+    @njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+    def _process_block_kernel(samples, scale, alphas, zi, out_rms, out_band_rms):  # pragma: no cover - compiled
+        """Fused int16 -> float, per-channel RMS and band RMS for one (frames, channels) block.
+
+        ``alphas`` is (bands, 2) holding the one-pole HP and LP coefficients. ``zi`` is the
+        (bands, 2, channels) filter state, HP then LP, updated in place.
+        """
+        frames, channels = samples.shape
+        bands = alphas.shape[0]
+        # One pass over the block: each sample is read once and pushed through every band.
+        # Per-band coefficients and (channel, band) state sit in small contiguous scratch arrays
+        # so the innermost band loop is independent recurrences LLVM can vectorise.
+        a_hp = np.empty(bands)
+        a_lp = np.empty(bands)
+        d_lp = np.empty(bands)
+        for b in range(bands):
+            a_hp[b] = alphas[b, 0]
+            a_lp[b] = alphas[b, 1]
+            d_lp[b] = 1.0 - alphas[b, 1]
+        z_hp = np.empty((channels, bands))
+        z_lp = np.empty((channels, bands))
+        acc = np.zeros((channels, bands))
+        sq = np.zeros(channels)
+        for ch in range(channels):
+            for b in range(bands):
+                z_hp[ch, b] = zi[b, 0, ch]
+                z_lp[ch, b] = zi[b, 1, ch]
+        for i in range(frames):
+            for ch in range(channels):
+                x = samples[i, ch] * scale
+                sq[ch] += x * x
+                for b in range(bands):
+                    # hp: y[n] = a_hp * (y[n-1] + x[n] - x[n-1]), state z = a_hp * (y[n-1] - x[n-1])
+                    y = a_hp[b] * x + z_hp[ch, b]
+                    z_hp[ch, b] = a_hp[b] * (y - x)
+                    # lp: y[n] = a_lp * x[n] + (1 - a_lp) * y[n-1], state z = (1 - a_lp) * y[n-1]
+                    y = a_lp[b] * y + z_lp[ch, b]
+                    z_lp[ch, b] = d_lp[b] * y
+                    acc[ch, b] += y * y
+        for ch in range(channels):
+            out_rms[ch] = np.sqrt(sq[ch] / frames)
+        for b in range(bands):
+            total = 0.0
+            for ch in range(channels):
+                zi[b, 0, ch] = z_hp[ch, b]
+                zi[b, 1, ch] = z_lp[ch, b]
+                total += np.sqrt(acc[ch, b] / frames)
+            out_band_rms[b] = total / channels
+
+else:
+    _process_block_kernel = None
+
+
+class BandState:
+    """Per-band config, filter coefficients/state and Tk wiring (slots: attribute loads, no dict)."""
+
+    __slots__ = (
+        "label",
+        "low_cut",
+        "high_cut",
+        "color",
+        "gradient",
+        "last",
+        "min",
+        "max",
+        "window",
+        "min_var",
+        "max_var",
+        "hp_alpha",
+        "lp_alpha",
+        "hp_ba",
+        "lp_ba",
+        "zi",
+    )
+
+    def __init__(
+        self,
+        label: str,
+        low_cut: float,
+        high_cut: float,
+        color: str,
+        min_val: float,
+        max_val: float,
+        gradient: bool,
+    ) -> None:
+        self.label = label
+        self.low_cut = low_cut
+        self.high_cut = high_cut
+        self.color = color
+        self.gradient = gradient
+        self.last = 0.0
+        self.min = min_val
+        self.max = max_val
+        self.window: "BandWindow | None" = None
+        self.min_var: tk.StringVar | None = None
+        self.max_var: tk.StringVar | None = None
+        self.hp_alpha = 0.0
+        self.lp_alpha = 0.0
+        self.hp_ba: tuple[np.ndarray, np.ndarray] | None = None
+        self.lp_ba: tuple[np.ndarray, np.ndarray] | None = None
+        self.zi: np.ndarray | None = None
+
+
 class LoopbackMonitorApp:
-    """Simple 120 FPS RMS monitor using PyAudio loopback on Windows."""
+    """Simple RMS monitor using PyAudio loopback on Windows."""
 
-    def __init__(self, root: tk.Tk, target_fps: int = 120) -> None:
+    def __init__(self, root: tk.Tk, target_fps: int = 120, gui_fps: int = 60) -> None:
         self.root = root
         self.root.title("Loopback RMS Monitor")
         self.root.geometry("360x400")
         self.root.resizable(True, True)
+        # target_fps is the minimum audio block rate: blocks are rounded up to a power of two, so
+        # the real DSP/beat rate is block_rate (~86-94 blocks/s at 120). gui_fps paces the Tk
+        # redraws, which only need to keep up with the display and coalesce the blocks meanwhile.
         self.target_fps = target_fps
+        self.gui_fps = gui_fps
 
         self.status_var = tk.StringVar(value="Preparing...")
         self.left_db_var = tk.StringVar(value="-inf dBFS")
         self.right_db_var = tk.StringVar(value="-inf dBFS")
         self.low_band_byte_var = tk.StringVar(value="0")
+        self._var_text: dict[str, str] = {}
         self.serial_port_var = tk.StringVar(value="COM3")
         self.serial_baud_var = tk.StringVar(value="115200")
         default_serial_status = "Serial: disconnected" if SERIAL_AVAILABLE else "Serial: pyserial not installed"
@@ -68,8 +257,16 @@ class LoopbackMonitorApp:
 
         self.band_config_path = Path(__file__).with_name("band_limits.json")
         self._persisted_limits = self._load_band_limits()
-
-        self.rms_queue: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=24)
+        self._save_after_id: str | None = None
+
+        # Latest (seq, rms, band_values, beat) snapshot published by the audio thread. A single
+        # attribute store is atomic under the GIL, so the GUI always sees one coherent block.
+        self._latest_block: "tuple[int, np.ndarray, list[float], float] | None" = None
+        self._block_seq = 0
+        self._consumed_seq = 0
+        # Set by settings handlers so _update_gui redraws once even when no new block arrives
+        # (WASAPI loopback delivers no callbacks during silence).
+        self._gui_dirty = False
         self.status_queue: "queue.Queue[str]" = queue.Queue(maxsize=24)
         self.last_rms = np.zeros(2, dtype=np.float32)
         self._smoothed_rms = np.zeros(2, dtype=np.float32)
@@ -82,8 +279,11 @@ class LoopbackMonitorApp:
         self.output_device_name = "Unknown"
         self.using_loopback = False
         self.samplerate = 44100
+        self._inv_sr = 1.0 / self.samplerate
         self.channels = 2
-        self.blocksize = max(128, int(self.samplerate / max(1, self.target_fps)))
+        self.blocksize = _pow2_blocksize(self.samplerate, self.target_fps)
+        self.block_rate = self.samplerate / self.blocksize
+        self._fbuf = _aligned_empty((self.channels, self.blocksize))
 
         self.band_definitions = [
             {"label": "20-60 Hz", "low": 20.0, "high": 60.0, "color": "#d4af37"},
@@ -93,15 +293,20 @@ class LoopbackMonitorApp:
             {"label": "2-6 kHz", "low": 2000.0, "high": 6000.0, "color": "#fff1a4"},
             {"label": "6-20 kHz", "low": 6000.0, "high": 20000.0, "color": "#fff7d6"},
         ]
-        self.band_states: list[dict] = []
+        self.band_states: list[BandState] = []
         self._create_band_states()
+        self._band_alphas: np.ndarray | None = None
+        self._band_zi: np.ndarray | None = None
+        self._dsp_rms = np.zeros(self.channels, dtype=np.float32)
+        self._dsp_band_rms = np.zeros(len(self.band_states), dtype=np.float32)
+        self._dsp_ready = False
         self.circular_window: "CircularRMSWindow | None" = None
         self.neon_window: "NeonWaveWindow | None" = None
         self.moving_average_var = tk.BooleanVar(value=False)
         self.moving_average_ms_var = tk.DoubleVar(value=100.0)
         self._ma_ms_trace_guard = 0
+        self._ma_window_s = 0.1
 
-        self.beat_queue: "queue.Queue[float]" = queue.Queue(maxsize=24)
         self.beat_last = 0.0
         self.beat_detector: "BeatDetectorRNN | None" = None
 
@@ -112,7 +317,11 @@ class LoopbackMonitorApp:
         self.serial_port_combo: ttk.Combobox | None = None
         self.available_serial_ports: list[str] = []
         self.serial_include_high_var = tk.BooleanVar(value=False)
+        # Preallocated binary frames (sync byte, value count, values; see microbib.md), filled in place.
+        self._serial_frame_low = bytearray((SERIAL_SYNC_BYTE, 1, 0))
+        self._serial_frame_pair = bytearray((SERIAL_SYNC_BYTE, 2, 0, 0))
 
+        self._start_dsp_warmup()
         self._build_gui()
 
         try:
@@ -124,6 +333,11 @@ class LoopbackMonitorApp:
 
         self._schedule_gui_updates()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Startup objects (Tk wrappers, torch/numba modules, weights) live for the whole session;
+        # freezing them keeps full collections short, so a GC pass inside the audio callback
+        # does not have to walk them.
+        gc.collect()
+        gc.freeze()
 
     def _create_band_states(self) -> None:
         self.band_states = []
@@ -138,46 +352,43 @@ class LoopbackMonitorApp:
                 color = saved_color.lower()
             else:
                 color = band["color"]
-            state = {
-                "label": band["label"],
-                "low_cut": float(band["low"]),
-                "high_cut": float(band["high"]),
-                "color": color,
-                "queue": queue.Queue(maxsize=24),
-                "last": 0.0,
-                "raw_last": 0.0,
-                "smoothed_last": None,
-                "min": saved_min,
-                "max": saved_max,
-                "window": None,
-                "min_var": None,
-                "max_var": None,
-                "hp_alpha": 0.0,
-                "lp_alpha": 0.0,
-                "hp_prev_input": None,
-                "hp_prev_output": None,
-                "lp_prev_output": None,
-                "gradient": bool(saved.get("gradient", False)),
-            }
+            state = BandState(
+                label=band["label"],
+                low_cut=float(band["low"]),
+                high_cut=float(band["high"]),
+                color=color,
+                min_val=saved_min,
+                max_val=saved_max,
+                gradient=bool(saved.get("gradient", False)),
+            )
             self.band_states.append(state)
-        self._save_band_limits()
+        # Struct-of-arrays mirror of the per-band numbers touched every frame; the BandState
+        # objects keep the Tk/window wiring and receive last back via _sync_from_arrays().
+        count = len(self.band_states)
+        self._band_min = np.array([state.min for state in self.band_states], dtype=np.float32)
+        self._band_max = np.array([state.max for state in self.band_states], dtype=np.float32)
+        self._band_raw = np.zeros(count, dtype=np.float32)
+        self._band_smoothed = np.zeros(count, dtype=np.float32)
+        self._band_last = np.zeros(count, dtype=np.float32)
+        self._band_bytes = np.zeros(count, dtype=np.uint8)
+        self._schedule_save_band_limits()
 
     def _build_gui(self) -> None:
         main_frame = ttk.Frame(self.root, padding=12)
         main_frame.grid(column=0, row=0, sticky="nsew")
 
-        ttk.Label(main_frame, text="120 FPS RMS meters (L / R)").grid(
+        ttk.Label(main_frame, text="RMS meters (L / R)").grid(
             column=0, row=0, columnspan=2, sticky="w"
         )
 
-        self.left_meter = ttk.Progressbar(main_frame, orient="horizontal", length=260, maximum=100)
-        self.left_meter.grid(column=0, row=1, sticky="ew", padx=(0, 8))
+        self.left_meter = self._create_meter(main_frame)
+        self.left_meter["canvas"].grid(column=0, row=1, sticky="ew", padx=(0, 8))
         ttk.Label(main_frame, textvariable=self.left_db_var, width=10, anchor="e").grid(
             column=1, row=1, sticky="e"
         )
 
-        self.right_meter = ttk.Progressbar(main_frame, orient="horizontal", length=260, maximum=100)
-        self.right_meter.grid(column=0, row=2, sticky="ew", padx=(0, 8), pady=(6, 0))
+        self.right_meter = self._create_meter(main_frame)
+        self.right_meter["canvas"].grid(column=0, row=2, sticky="ew", padx=(0, 8), pady=(6, 0))
         ttk.Label(main_frame, textvariable=self.right_db_var, width=10, anchor="e").grid(
             column=1, row=2, sticky="e", pady=(6, 0)
         )
@@ -244,20 +455,20 @@ class LoopbackMonitorApp:
             pady = (10, 0) if idx == 0 else (6, 0)
             ttk.Button(
                 button_frame,
-                text=f"{state['label']} Monitor",
+                text=f"{state.label} Monitor",
                 command=lambda st=state: self._show_band_window(st),
             ).grid(column=0, row=idx + 1, sticky="ew", pady=pady)
 
             min_var = tk.DoubleVar()
             max_var = tk.DoubleVar()
-            min_var.set(f"{state['min']:.4f}")
-            max_var.set(f"{state['max']:.4f}")
+            min_var.set(f"{state.min:.4f}")
+            max_var.set(f"{state.max:.4f}")
             min_entry = ttk.Entry(button_frame, textvariable=min_var, width=7)
             max_entry = ttk.Entry(button_frame, textvariable=max_var, width=7)
             min_entry.grid(column=1, row=idx + 1, sticky="ew", padx=(0, 6), pady=pady)
             max_entry.grid(column=2, row=idx + 1, sticky="ew", padx=(0, 6), pady=pady)
-            state["min_var"] = min_var
-            state["max_var"] = max_var
+            state.min_var = min_var
+            state.max_var = max_var
 
             if idx == 0:
                 self.low_band_color_button = tk.Button(
@@ -269,9 +480,9 @@ class LoopbackMonitorApp:
                     padx=6,
                 )
                 self.low_band_color_button.grid(column=3, row=idx + 1, sticky="ew", padx=(6, 0), pady=pady)
-                self._update_low_band_button_color(state["color"])
+                self._update_low_band_button_color(state.color)
 
-                self.low_band_gradient_var = tk.BooleanVar(value=state.get("gradient", False))
+                self.low_band_gradient_var = tk.BooleanVar(value=state.gradient)
                 gradient_cb = ttk.Checkbutton(
                     button_frame,
                     variable=self.low_band_gradient_var,
@@ -342,6 +553,40 @@ class LoopbackMonitorApp:
 
         self._refresh_serial_ports()
 
+    def _create_meter(self, parent: tk.Misc) -> dict:
+        """Canvas-backed level meter; cheaper to update every frame than a themed Progressbar."""
+        canvas = tk.Canvas(
+            parent,
+            width=260,
+            height=METER_HEIGHT,
+            bg="#e6e6e6",
+            highlightthickness=0,
+            borderwidth=0,
+        )
+        meter = {
+            "canvas": canvas,
+            "rect": canvas.create_rectangle(0, 0, 0, METER_HEIGHT, fill="#06b025", outline=""),
+            "width": 260,
+            "value": 0.0,
+            "last_px": 0,
+        }
+        canvas.bind("<Configure>", lambda event, m=meter: self._on_meter_resize(m, event))
+        return meter
+
+    def _on_meter_resize(self, meter: dict, event) -> None:
+        meter["width"] = max(1, int(event.width))
+        meter["last_px"] = -1
+        self._set_meter_value(meter, meter["value"])
+
+    @staticmethod
+    def _set_meter_value(meter: dict, value: float) -> None:
+        """Set a 0-100 meter value; Tk is only touched when the bar changes by a whole pixel."""
+        meter["value"] = value
+        px = int(meter["width"] * value / 100.0)
+        if px != meter["last_px"]:
+            meter["canvas"].coords(meter["rect"], 0, 0, px, METER_HEIGHT)
+            meter["last_px"] = px
+
     def _set_serial_status(self, message: str) -> None:
         self.serial_status_var.set(f"Serial: {message}")
 
@@ -433,46 +678,42 @@ class LoopbackMonitorApp:
             self.serial_button.configure(text="Connect")
         self.serial_include_high_var.set(False)
 
-    def _send_serial_values(self, values: list[int | None]) -> None:
+    def _send_serial_values(self, low: int, high: int | None = None) -> None:
         conn = self.serial_conn
         if conn is None:
             return
-        if not values:
-            return
-        parts: list[str] = []
-        for value in values:
-            if value is None:
-                continue
-            safe_value = max(0, min(255, int(value)))
-            parts.append(str(safe_value))
-        if not parts:
-            return
-        payload = ",".join(parts) + "\n"
+        if high is None:
+            frame = self._serial_frame_low
+        else:
+            frame = self._serial_frame_pair
+            frame[3] = min(high, SERIAL_MAX_VALUE)
+        frame[2] = min(low, SERIAL_MAX_VALUE)
         try:
-            conn.write(payload.encode("ascii"))
+            conn.write(frame)
         except Exception as exc:  # pragma: no cover - hardware dependent
             self.logger.warning("Serial write failed: %s", exc)
             self._set_serial_status("Write failed; disconnected")
             self._disconnect_serial()
 
-    def _show_band_window(self, state: dict) -> None:
-        window = state["window"]
+    def _show_band_window(self, state: BandState) -> None:
+        window = state.window
         if window is not None and window.winfo_exists():
             window.lift()
             return
 
         window = BandWindow(
             self.root,
-            title=f"{state['label']} RMS",
-            rms_to_db=self._rms_to_db,
-            get_limits=lambda st=state: self._get_band_limits(st),
-            set_limits=lambda min_val, max_val, st=state: self._set_band_limits(st, min_val, max_val),
-            base_color=state["color"],
-            gradient_mode=state.get("gradient", False),
+            title=f"{state.label} RMS",
+            band_index=self.band_states.index(state),
+            levels=self._band_last,
+            mins=self._band_min,
+            maxs=self._band_max,
+            base_color=state.color,
+            gradient_mode=state.gradient,
             on_close=lambda st=state: self._on_band_window_closed(st),
         )
-        state["window"] = window
-        window.update_level(state["last"])
+        state.window = window
+        window.update_level()
         window.update_beat(self.beat_last)
 
     def _show_circular_window(self) -> None:
@@ -487,12 +728,12 @@ class LoopbackMonitorApp:
             get_limits=lambda: self._get_band_limits(low_band_state),
             get_high_band_limits=lambda: self._get_band_limits(high_band_state),
             include_high_var=self.circular_include_high_var,
-            base_color=low_band_state["color"],
-            high_color=high_band_state["color"],
-            gradient_mode=low_band_state.get("gradient", False),
+            base_color=low_band_state.color,
+            high_color=high_band_state.color,
+            gradient_mode=low_band_state.gradient,
             on_close=self._on_circular_window_closed,
         )
-        self.circular_window.update_levels(low_band_state["last"], high_band_state["last"])
+        self.circular_window.update_levels(low_band_state.last, high_band_state.last)
         self.circular_window.update_beat(self.beat_last)
 
     def _show_neon_window(self) -> None:
@@ -509,32 +750,36 @@ class LoopbackMonitorApp:
         initial_level = float(np.mean(self.last_rms)) if hasattr(self.last_rms, "__len__") else float(self.last_rms)
         self.neon_window.update_wave(initial_level, self.beat_last, self._last_gui_dt)
 
-    def _get_band_limits(self, state: dict) -> tuple[float, float]:
-        return state["min"], state["max"]
+    def _get_band_limits(self, state: BandState) -> tuple[float, float]:
+        return state.min, state.max
 
-    def _set_band_limits(self, state: dict, min_val: float, max_val: float) -> None:
+    def _set_band_limits(self, state: BandState, min_val: float, max_val: float) -> None:
         min_val = max(0.0, round(float(min_val), 4))
         max_val = round(float(max_val), 4)
         if max_val < min_val:
             max_val = min_val
 
-        state["min"] = min_val
-        state["max"] = max_val
-        if state.get("min_var") is not None:
-            state["min_var"].set(f"{state['min']:.4f}")
-        if state.get("max_var") is not None:
-            state["max_var"].set(f"{state['max']:.4f}")
+        state.min = min_val
+        state.max = max_val
+        idx = self.band_states.index(state)
+        self._band_min[idx] = min_val
+        self._band_max[idx] = max_val
+        if state.min_var is not None:
+            state.min_var.set(f"{state.min:.4f}")
+        if state.max_var is not None:
+            state.max_var.set(f"{state.max:.4f}")
 
         self.logger.debug(
             "Band limits updated for %s: min=%.4f max=%.4f",
-            state["label"],
+            state.label,
             min_val,
             max_val,
         )
-        self._save_band_limits()
+        self._gui_dirty = True
+        self._schedule_save_band_limits()
 
-    def _on_band_window_closed(self, state: dict) -> None:
-        state["window"] = None
+    def _on_band_window_closed(self, state: BandState) -> None:
+        state.window = None
 
     def _on_circular_window_closed(self) -> None:
         self.circular_window = None
@@ -542,27 +787,27 @@ class LoopbackMonitorApp:
     def _on_neon_window_closed(self) -> None:
         self.neon_window = None
 
-    def _choose_band_color(self, state: dict) -> None:
-        initial = state.get("color", "#d4af37")
-        _rgb, hex_color = colorchooser.askcolor(color=initial, title=f"{state['label']} Color", parent=self.root)
+    def _choose_band_color(self, state: BandState) -> None:
+        initial = state.color
+        _rgb, hex_color = colorchooser.askcolor(color=initial, title=f"{state.label} Color", parent=self.root)
         if not hex_color:
             return
         self._set_band_color(state, hex_color)
 
-    def _set_band_color(self, state: dict, color: str) -> None:
+    def _set_band_color(self, state: BandState, color: str) -> None:
         if not isinstance(color, str):
             return
         color = color.strip().lower()
         if not color.startswith("#") or len(color) != 7:
             return
-        if state.get("color") == color:
+        if state.color == color:
             return
-        state["color"] = color
+        state.color = color
         for band in self.band_definitions:
-            if band["label"] == state["label"]:
+            if band["label"] == state.label:
                 band["color"] = color
                 break
-        window = state.get("window")
+        window = state.window
         if window is not None and window.winfo_exists():
             window.set_base_color(color)
         if state is self.band_states[0]:
@@ -570,21 +815,22 @@ class LoopbackMonitorApp:
                 self._update_low_band_button_color(color)
             if self.circular_window is not None and self.circular_window.winfo_exists():
                 self.circular_window.set_base_color(color)
-        self._save_band_limits()
+        self._gui_dirty = True
+        self._schedule_save_band_limits()
 
-    def _apply_gradient_toggle(self, state: dict) -> None:
+    def _apply_gradient_toggle(self, state: BandState) -> None:
         if state is self.band_states[0]:
             desired = bool(self.low_band_gradient_var.get())
         else:
             desired = False
         self._set_band_gradient(state, desired)
 
-    def _set_band_gradient(self, state: dict, enabled: bool) -> None:
+    def _set_band_gradient(self, state: BandState, enabled: bool) -> None:
         enabled = bool(enabled)
-        if state.get("gradient", False) == enabled:
+        if state.gradient == enabled:
             return
-        state["gradient"] = enabled
-        window = state.get("window")
+        state.gradient = enabled
+        window = state.window
         if window is not None and window.winfo_exists():
             window.set_gradient_mode(enabled)
         if state is self.band_states[0]:
@@ -592,7 +838,8 @@ class LoopbackMonitorApp:
                 self.low_band_gradient_var.set(enabled)
             if self.circular_window is not None and self.circular_window.winfo_exists():
                 self.circular_window.set_gradient_mode(enabled)
-        self._save_band_limits()
+        self._gui_dirty = True
+        self._schedule_save_band_limits()
 
     def _update_low_band_button_color(self, color: str) -> None:
         if not hasattr(self, "low_band_color_button"):
@@ -613,12 +860,12 @@ class LoopbackMonitorApp:
 
     def _reset_moving_average_state(self) -> None:
         self._last_update_ts = None
-        self._smoothed_rms = np.array(self.last_rms, dtype=np.float32, copy=True)
-        for state in self.band_states:
-            state["smoothed_last"] = state["raw_last"]
+        self._smoothed_rms[:] = self.last_rms
+        self._band_smoothed[:] = self._band_raw
 
     def _set_moving_average_ms(self, value: float) -> float:
         clamped = max(1.0, min(2000.0, round(float(value))))
+        self._ma_window_s = clamped / 1000.0
         self._ma_ms_trace_guard += 1
         self.moving_average_ms_var.set(int(clamped))
         if hasattr(self, "root"):
@@ -640,6 +887,7 @@ class LoopbackMonitorApp:
         if abs(clamped - value) > 1e-6:
             self._set_moving_average_ms(clamped)
             return
+        self._ma_window_s = clamped / 1000.0
         if self.moving_average_var.get():
             self._reset_moving_average_state()
 
@@ -670,7 +918,7 @@ class LoopbackMonitorApp:
             self._reset_moving_average_state()
         return "break"
 
-    def _on_scroll_limits(self, event, state: dict, var: tk.DoubleVar, is_min: bool) -> None:
+    def _on_scroll_limits(self, event, state: BandState, var: tk.DoubleVar, is_min: bool) -> None:
         delta = getattr(event, "delta", 0)
         if delta == 0:
             return
@@ -678,20 +926,20 @@ class LoopbackMonitorApp:
         if steps == 0:
             steps = 1 if delta > 0 else -1
         step = 0.0001 * steps
-        base_value = state["min"] if is_min else state["max"]
+        base_value = state.min if is_min else state.max
         new_value = round(base_value + step, 4)
         if is_min:
             min_val = max(0.0, new_value)
-            max_val = max(state["max"], min_val)
+            max_val = max(state.max, min_val)
             self._set_band_limits(state, min_val, max_val)
         else:
-            min_val = state["min"]
+            min_val = state.min
             max_val = max(min_val, new_value)
             self._set_band_limits(state, min_val, max_val)
 
-        window = state.get("window")
+        window = state.window
         if window is not None and window.winfo_exists():
-            window.update_level(state["last"])
+            window.update_level()
             window.update_beat(self.beat_last)
 
     def _load_band_limits(self) -> dict:
@@ -713,18 +961,33 @@ class LoopbackMonitorApp:
                 continue
         return result
 
+    def _schedule_save_band_limits(self, delay_ms: int = 500) -> None:
+        """Coalesce bursts of limit/color edits (e.g. mouse wheel ticks) into one write."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(delay_ms, self._flush_save_band_limits)
+
+    def _flush_save_band_limits(self) -> None:
+        self._save_after_id = None
+        self._save_band_limits()
+
     def _save_band_limits(self) -> None:
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        tmp_path = self.band_config_path.with_name(self.band_config_path.name + ".tmp")
         try:
             data = {}
             for state in self.band_states:
-                data[state["label"]] = {
-                    "min": state["min"],
-                    "max": state["max"],
-                    "color": state.get("color"),
-                    "gradient": bool(state.get("gradient", False)),
+                data[state.label] = {
+                    "min": state.min,
+                    "max": state.max,
+                    "color": state.color,
+                    "gradient": bool(state.gradient),
                 }
-            with self.band_config_path.open("w", encoding="utf-8") as fh:
+            with tmp_path.open("w", encoding="utf-8") as fh:
                 json.dump(data, fh, indent=2)
+            os.replace(tmp_path, self.band_config_path)
         except OSError:
             self.logger.exception("Failed to save band limits.")
 
@@ -744,8 +1007,14 @@ class LoopbackMonitorApp:
             self.using_loopback,
             self.output_device_name,
         ) = self._select_device()
+        self._inv_sr = 1.0 / self.samplerate
 
-        self.blocksize = max(64, int(self.samplerate / max(1, self.target_fps)))
+        # Power-of-two blocks keep numpy/numba reductions on whole SIMD lanes; at 44.1/48 kHz
+        # this gives ~86-94 blocks/s, still above gui_fps, so every redraw sees fresh data.
+        self.blocksize = _pow2_blocksize(self.samplerate, self.target_fps)
+        self.block_rate = self.samplerate / self.blocksize
+        self._fbuf = _aligned_empty((self.channels, self.blocksize))
+        self._configure_band_filters()
         params: dict[str, object] = {
             "format": AUDIO_FORMAT,
             "channels": self.channels,
@@ -764,29 +1033,33 @@ class LoopbackMonitorApp:
             messagebox.showerror("Audio Error", f"Audio stream could not start:\n{exc}")
             raise
 
-        self._configure_band_filters()
         self.beat_last = 0.0
-        if TORCH_AVAILABLE:
+        if NUMBA_AVAILABLE or TORCH_AVAILABLE:
             try:
-                self.beat_detector = BeatDetectorRNN(self.channels)
+                self.beat_detector = BeatDetectorRNN(
+                    self.channels,
+                    block_rate=self.block_rate,
+                    onnx_path=self.band_config_path.with_name("beat_detector.onnx"),
+                )
                 self.logger.info("BeatDetectorRNN initialized.")
             except Exception as exc:
                 self.beat_detector = None
                 self.logger.warning("Beat detector initialization failed: %s", exc)
         else:
-            self.logger.warning("PyTorch not available; beat detector disabled.")
+            self.logger.warning("Neither numba nor PyTorch available; beat detector disabled.")
 
         desc = "loopback" if self.using_loopback else "input"
         self.status_var.set(
             f"Device: {self.input_device_name} ({desc}), {self.samplerate} Hz"
         )
         self.logger.info(
-            "Stream started - output=%s input=%s loopback=%s samplerate=%s blocksize=%s",
+            "Stream started - output=%s input=%s loopback=%s samplerate=%s blocksize=%s (%.1f blocks/s)",
             self.output_device_name,
             self.input_device_name,
             self.using_loopback,
             self.samplerate,
             self.blocksize,
+            self.block_rate,
         )
 
     def _select_device(
@@ -873,259 +1146,261 @@ class LoopbackMonitorApp:
             band_values = [0.0] * len(self.band_states)
             if raw.size == 0:
                 rms = np.zeros(2, dtype=np.float32)
+            elif self._dsp_ready and self._band_zi is not None:
+                samples = raw.reshape(-1, self.channels)
+                _process_block_kernel(
+                    samples,
+                    INV_INT16_MAX_F32,
+                    self._band_alphas,
+                    self._band_zi,
+                    self._dsp_rms,
+                    self._dsp_band_rms,
+                )
+                rms = np.repeat(self._dsp_rms, 2) if self._dsp_rms.size == 1 else self._dsp_rms[:2].copy()
+                band_values = [float(value) for value in self._dsp_band_rms]
             else:
-                audio = raw.reshape(-1, self.channels).astype(np.float32) / INT16_MAX
-                full_rms = np.sqrt(np.mean(np.square(audio), axis=0))
+                view = raw.reshape(-1, self.channels).T
+                if view.shape == self._fbuf.shape:
+                    audio = np.multiply(view, INV_INT16_MAX_F32, out=self._fbuf)
+                else:
+                    audio = np.multiply(view, INV_INT16_MAX_F32, dtype=np.float32, order="C")
+                full_rms = _rms(audio)
                 if full_rms.size == 1:
                     rms = np.repeat(full_rms, 2)
                 else:
                     rms = full_rms[:2]
 
-                for idx, state in enumerate(self.band_states):
-                    band_values[idx] = self._process_band(audio, state)
-
-            for value, state in zip(band_values, self.band_states):
-                try:
-                    state["queue"].put_nowait(value)
-                except queue.Full:
-                    pass
+                # Without scipy the bands stay at zero until the numba kernel is ready.
+                if self.band_states and SCIPY_AVAILABLE:
+                    filtered = self._filter_bands(audio)
+                    band_rms = _rms(filtered.reshape(-1, filtered.shape[-1])).reshape(filtered.shape[:2])
+                    band_values = [float(value) for value in np.mean(band_rms, axis=-1)]
 
             low_value = band_values[0] if band_values else 0.0
             if self.beat_detector is not None:
                 beat_prob = self.beat_detector.process(low_value)
             else:
                 beat_prob = float(min(1.0, max(0.0, low_value * 5.0)))
-            try:
-                self.beat_queue.put_nowait(beat_prob)
-            except queue.Full:
-                pass
         except ValueError:
             rms = np.zeros(2, dtype=np.float32)
             band_values = [0.0] * len(self.band_states)
-            for value, state in zip(band_values, self.band_states):
-                try:
-                    state["queue"].put_nowait(value)
-                except queue.Full:
-                    pass
             if self.beat_detector is not None:
                 beat_prob = self.beat_detector.process(0.0)
             else:
                 beat_prob = 0.0
-            try:
-                self.beat_queue.put_nowait(beat_prob)
-            except queue.Full:
-                pass
 
-        try:
-            self.rms_queue.put_nowait(rms)
-        except queue.Full:
-            pass
+        self._block_seq += 1
+        self._latest_block = (self._block_seq, rms, band_values, beat_prob)
 
         return (None, pyaudio.paContinue)
 
     def _configure_band_filters(self) -> None:
         for state in self.band_states:
             self._reset_band_filter(state)
+        if not self.band_states:
+            return
+        # Stack coefficients/state so the numba kernel sees every band at once; the per-band
+        # state becomes a view into the stack, so both DSP paths share the filter state.
+        self._band_alphas = np.array(
+            [(state.hp_alpha, state.lp_alpha) for state in self.band_states], dtype=np.float32
+        )
+        self._band_zi = np.ascontiguousarray(np.stack([state.zi for state in self.band_states]))
+        for idx, state in enumerate(self.band_states):
+            state.zi = self._band_zi[idx]
+        self._dsp_rms = np.zeros(self.channels, dtype=np.float32)
+        self._dsp_band_rms = np.zeros(len(self.band_states), dtype=np.float32)
+
+    def _start_dsp_warmup(self) -> None:
+        if not NUMBA_AVAILABLE:
+            if not SCIPY_AVAILABLE:
+                self._report_no_band_filter()
+            return
+        threading.Thread(target=self._warm_dsp_kernel, name="dsp-warmup", daemon=True).start()
 
-    def _reset_band_filter(self, state: dict) -> None:
-        state["hp_alpha"] = self._highpass_alpha(state["low_cut"])
-        state["lp_alpha"] = self._lowpass_alpha(state["high_cut"])
-        state["hp_prev_input"] = np.zeros(self.channels, dtype=np.float32)
-        state["hp_prev_output"] = np.zeros(self.channels, dtype=np.float32)
-        state["lp_prev_output"] = np.zeros(self.channels, dtype=np.float32)
-        state["last"] = 0.0
-
-    def _process_band(self, audio: np.ndarray, state: dict) -> float:
-        if audio.size == 0:
-            return 0.0
-
-        if (
-            state["hp_prev_input"] is None
-            or state["hp_prev_output"] is None
-            or state["lp_prev_output"] is None
-        ):
-            self._reset_band_filter(state)
+    def _warm_dsp_kernel(self) -> None:
+        """Compile (or load from cache) the numba kernel off the Tk thread; numpy path runs meanwhile."""
+        try:
+            # Read-only int16 like np.frombuffer(in_data) so the real call hits the same specialization.
+            samples = np.frombuffer(bytes(2 * 2 * 64), dtype=np.int16).reshape(-1, 2)
+            _process_block_kernel(
+                samples,
+                INV_INT16_MAX_F32,
+                np.zeros((1, 2), dtype=np.float32),
+                np.zeros((1, 2, 2), dtype=np.float32),
+                np.zeros(2, dtype=np.float32),
+                np.zeros(1, dtype=np.float32),
+            )
+        except Exception as exc:  # pragma: no cover - depends on the numba/llvmlite install
+            if SCIPY_AVAILABLE:
+                self.logger.warning("Numba DSP kernel unavailable; using scipy path: %s", exc)
+            else:
+                self.logger.warning("Numba DSP kernel unavailable: %s", exc)
+                self._report_no_band_filter()
+            return
+        self._dsp_ready = True
+        self.logger.debug("Numba DSP kernel ready.")
+
+    def _report_no_band_filter(self) -> None:
+        msg = "Band filtering unavailable: install numba or scipy. Band meters will read zero."
+        self.logger.error(msg)
+        try:
+            self.status_queue.put_nowait(msg)
+        except queue.Full:
+            pass
 
-        high_passed = np.empty_like(audio)
-        hp_input = state["hp_prev_input"]
-        hp_output = state["hp_prev_output"]
-        alpha_hp = state["hp_alpha"]
-
-        for ch in range(audio.shape[1]):
-            prev_in = hp_input[ch]
-            prev_out = hp_output[ch]
-            channel_data = audio[:, ch]
-            out_channel = high_passed[:, ch]
-            for idx, sample in enumerate(channel_data):
-                filtered = alpha_hp * (prev_out + sample - prev_in)
-                out_channel[idx] = filtered
-                prev_out = filtered
-                prev_in = sample
-            hp_input[ch] = prev_in
-            hp_output[ch] = prev_out
-
-        bandpassed = np.empty_like(high_passed)
-        lp_output = state["lp_prev_output"]
-        alpha_lp = state["lp_alpha"]
-
-        for ch in range(high_passed.shape[1]):
-            prev = lp_output[ch]
-            channel_data = high_passed[:, ch]
-            out_channel = bandpassed[:, ch]
-            for idx, sample in enumerate(channel_data):
-                prev = prev + alpha_lp * (sample - prev)
-                out_channel[idx] = prev
-            lp_output[ch] = prev
-
-        rms_vals = np.sqrt(np.mean(np.square(bandpassed), axis=0))
-        return float(np.mean(rms_vals))
+    def _reset_band_filter(self, state: BandState) -> None:
+        hp_alpha = self._highpass_alpha(state.low_cut)
+        lp_alpha = self._lowpass_alpha(state.high_cut)
+        state.hp_alpha = hp_alpha
+        state.lp_alpha = lp_alpha
+        # One-pole HP followed by one-pole LP, as lfilter (b, a) pairs:
+        #   hp: y[n] = a_hp * (y[n-1] + x[n] - x[n-1])
+        #   lp: y[n] = y[n-1] + a_lp * (x[n] - y[n-1])
+        state.hp_ba = (
+            np.array([hp_alpha, -hp_alpha], dtype=np.float32),
+            np.array([1.0, -hp_alpha], dtype=np.float32),
+        )
+        state.lp_ba = (
+            np.array([lp_alpha], dtype=np.float32),
+            np.array([1.0, lp_alpha - 1.0], dtype=np.float32),
+        )
+        # (2, channels): the single state value of each first-order filter, HP then LP. lfilter
+        # and the numba kernel use the same transposed direct-form II state, so they share it.
+        state.zi = np.zeros((2, self.channels), dtype=np.float32)
+        state.last = 0.0
+
+    def _filter_bands(self, audio: np.ndarray) -> np.ndarray:
+        """Band-pass ``audio`` (channels x frames) for every band, returning (bands, channels, frames)."""
+        if self._band_zi is None or self._band_zi.shape[-1] != audio.shape[0]:
+            self._configure_band_filters()
+        filtered = np.empty((len(self.band_states),) + audio.shape, dtype=np.float32)
+        for idx, state in enumerate(self.band_states):
+            zi = state.zi
+            (b_hp, a_hp), (b_lp, a_lp) = state.hp_ba, state.lp_ba
+            high_passed, zi[0, :, None] = lfilter(b_hp, a_hp, audio, axis=-1, zi=zi[0, :, None])
+            filtered[idx], zi[1, :, None] = lfilter(b_lp, a_lp, high_passed, axis=-1, zi=zi[1, :, None])
+        return filtered
 
     def _highpass_alpha(self, cutoff: float) -> float:
-        dt = 1.0 / self.samplerate
+        dt = self._inv_sr
         rc = 1.0 / (2.0 * math.pi * cutoff)
         return rc / (rc + dt)
 
     def _lowpass_alpha(self, cutoff: float) -> float:
-        dt = 1.0 / self.samplerate
+        dt = self._inv_sr
         rc = 1.0 / (2.0 * math.pi * cutoff)
         return dt / (rc + dt)
 
     def _schedule_gui_updates(self) -> None:
-        interval_ms = max(1, round(1000 / max(1, self.target_fps)))
+        interval_ms = max(1, int(1000 / max(1, self.gui_fps)))
         self._update_gui()
         self.root.after(interval_ms, self._schedule_gui_updates)
 
     def _update_gui(self) -> None:
         now = time.perf_counter()
         if self._last_update_ts is None:
-            dt = 1.0 / max(1, self.target_fps)
+            dt = 1.0 / max(1, self.gui_fps)
         else:
             dt = max(1e-4, now - self._last_update_ts)
         self._last_update_ts = now
 
         use_moving_average = self.moving_average_var.get()
         if use_moving_average:
-            try:
-                window_ms = float(self.moving_average_ms_var.get())
-            except (tk.TclError, ValueError):
-                window_ms = 100.0
-            window_ms = max(1.0, min(2000.0, window_ms))
-            window_seconds = window_ms / 1000.0
-            alpha = 1.0 - math.exp(-dt / max(1e-6, window_seconds))
+            # Explicit float32 scalar: the EMA stays float32 regardless of NumPy's Python-scalar
+            # promotion rules, and no Python float is converted on each ufunc call.
+            alpha = np.float32(1.0 - math.exp(-dt / self._ma_window_s))
         else:
-            alpha = 1.0
+            alpha = np.float32(1.0)
         self._last_gui_dt = dt
 
         try:
-            while True:
-                rms = self.rms_queue.get_nowait()
-                self.last_rms = rms
+            status_msg = self.status_queue.get_nowait()
+            self.status_var.set(status_msg)
         except queue.Empty:
             pass
 
-        for state in self.band_states:
-            queue_ref = state["queue"]
-            updated = False
-            try:
-                while True:
-                    value = queue_ref.get_nowait()
-                    state["raw_last"] = value
-                    updated = True
-            except queue.Empty:
-                value = state["raw_last"]
-
-            if not updated:
-                value = state["raw_last"]
-
-            if use_moving_average:
-                if state["smoothed_last"] is None:
-                    state["smoothed_last"] = value
-                else:
-                    state["smoothed_last"] = (1.0 - alpha) * state["smoothed_last"] + alpha * value
-                state["last"] = state["smoothed_last"]
-            else:
-                state["smoothed_last"] = None
-                state["last"] = value
+        block = self._latest_block
+        if block is not None and block[0] != self._consumed_seq:
+            self._consumed_seq, rms, band_values, self.beat_last = block
+            self.last_rms[:] = rms
+            self._band_raw[:] = band_values
+        elif not use_moving_average and not self._gui_dirty:
+            # No new block, no settings change and nothing still easing: the screen is current.
+            return
+        self._gui_dirty = False
 
         if use_moving_average:
-            self._smoothed_rms = (1.0 - alpha) * self._smoothed_rms + alpha * self.last_rms
-            display_rms = self._smoothed_rms
+            self._band_smoothed += alpha * (self._band_raw - self._band_smoothed)
+            self._band_last[:] = self._band_smoothed
         else:
-            self._smoothed_rms = self.last_rms.copy()
-            display_rms = self.last_rms
+            np.copyto(self._band_smoothed, self._band_raw)
+            np.copyto(self._band_last, self._band_raw)
+        self._sync_from_arrays()
 
-        try:
-            while True:
-                beat_value = self.beat_queue.get_nowait()
-                self.beat_last = beat_value
-        except queue.Empty:
-            pass
-
-        left, right = (float(x) for x in display_rms)
+        if use_moving_average:
+            self._smoothed_rms += alpha * (self.last_rms - self._smoothed_rms)
+        else:
+            np.copyto(self._smoothed_rms, self.last_rms)
+        display_rms = self._smoothed_rms
 
-        left_db = self._rms_to_db(left)
-        right_db = self._rms_to_db(right)
+        left_db, right_db = (float(x) for x in self._rms_to_db_vec(display_rms))
 
-        self.left_db_var.set(self._db_text(left_db))
-        self.right_db_var.set(self._db_text(right_db))
+        self._set_text_var(self.left_db_var, self._db_text(left_db))
+        self._set_text_var(self.right_db_var, self._db_text(right_db))
 
-        self.left_meter["value"] = self._db_to_meter(left_db)
-        self.right_meter["value"] = self._db_to_meter(right_db)
+        self._set_meter_value(self.left_meter, self._db_to_meter(left_db))
+        self._set_meter_value(self.right_meter, self._db_to_meter(right_db))
         energy_level = float(np.mean(display_rms))
 
-        serial_values: list[int | None] = []
         if self.band_states:
-            low_state = self.band_states[0]
-            min_val, max_val = low_state["min"], low_state["max"]
-            if max_val <= min_val:
-                byte_value = 0
-            else:
-                normalized = (float(low_state["last"]) - min_val) / (max_val - min_val)
-                normalized = max(0.0, min(1.0, normalized))
-                byte_value = int(round(normalized * 255.0))
-            self.low_band_byte_var.set(str(byte_value))
-            serial_values.append(byte_value)
+            span = self._band_max - self._band_min
+            valid = span > 0.0
+            normalized = np.where(valid, (self._band_last - self._band_min) / np.where(valid, span, 1.0), 0.0)
+            np.clip(normalized, 0.0, 1.0, out=normalized)
+            # Quantise every band at once; rint rounds half to even like round() did.
+            np.multiply(normalized, 255.0, out=normalized)
+            np.rint(normalized, out=normalized)
+            self._band_bytes[:] = normalized
+
+            byte_value = int(self._band_bytes[0])
+            self._set_text_var(self.low_band_byte_var, str(byte_value))
 
             if self.serial_include_high_var.get() and len(self.band_states) > 1:
-                high_state = self.band_states[-1]
-                h_min, h_max = high_state["min"], high_state["max"]
-                if h_max <= h_min:
-                    high_byte = 0
-                else:
-                    h_norm = (float(high_state["last"]) - h_min) / (h_max - h_min)
-                    h_norm = max(0.0, min(1.0, h_norm))
-                    high_byte = int(round(h_norm * 255.0))
-                serial_values.append(high_byte)
-
-            self._send_serial_values(serial_values)
+                self._send_serial_values(byte_value, int(self._band_bytes[-1]))
+            else:
+                self._send_serial_values(byte_value)
         else:
-            self.low_band_byte_var.set("0")
+            self._set_text_var(self.low_band_byte_var, "0")
 
         for state in self.band_states:
-            window = state.get("window")
+            window = state.window
             if window is not None and window.winfo_exists():
-                window.update_level(state["last"])
+                window.update_level()
                 window.update_beat(self.beat_last)
 
         if self.circular_window is not None and self.circular_window.winfo_exists():
             low_state = self.band_states[0]
             high_state = self.band_states[-1]
-            self.circular_window.update_levels(low_state["last"], high_state["last"])
+            self.circular_window.update_levels(low_state.last, high_state.last)
             self.circular_window.update_beat(self.beat_last)
 
         if self.neon_window is not None and self.neon_window.winfo_exists():
             self.neon_window.update_wave(energy_level, self.beat_last, self._last_gui_dt)
 
-        try:
-            status_msg = self.status_queue.get_nowait()
-            self.status_var.set(status_msg)
-        except queue.Empty:
-            pass
+    def _set_text_var(self, var: tk.StringVar, text: str) -> None:
+        """Per-frame StringVar write that skips the Tcl round-trip when the text is unchanged."""
+        key = str(var)
+        if self._var_text.get(key) != text:
+            var.set(text)
+            self._var_text[key] = text
+
+    def _sync_from_arrays(self) -> None:
+        for state, last in zip(self.band_states, self._band_last.tolist()):
+            state.last = last
 
     @staticmethod
-    def _rms_to_db(value: float) -> float:
-        value = max(value, 1e-10)
-        return 20.0 * math.log10(value)
+    def _rms_to_db_vec(values: np.ndarray) -> np.ndarray:
+        return 20.0 * np.log10(np.maximum(values, 1e-10))
 
     @staticmethod
     def _db_text(db_value: float) -> str:
@@ -1157,18 +1432,20 @@ class LoopbackMonitorApp:
             finally:
                 self.pa = None
 
+        # Go through each window's own close path so its pending after() timers and traces are
+        # cancelled before the interpreter goes away.
         for state in self.band_states:
-            window = state.get("window")
+            window = state.window
             if window is not None and window.winfo_exists():
-                window.destroy()
-            state["window"] = None
+                window._handle_close()
+            state.window = None
 
         if self.circular_window is not None and self.circular_window.winfo_exists():
-            self.circular_window.destroy()
+            self.circular_window._handle_close()
         self.circular_window = None
 
         if self.neon_window is not None and self.neon_window.winfo_exists():
-            self.neon_window.destroy()
+            self.neon_window._handle_close()
         self.neon_window = None
 
         self._disconnect_serial()
@@ -1177,6 +1454,156 @@ class LoopbackMonitorApp:
         self.logger.info("Application closed.")
 
 
+# BeatNet weights (GRU gate order r, z, n as in torch.nn.GRU), shared by every backend.
+_BEAT_W_IH = np.array(
+    [
+        [-1.148892],
+        [-0.7618658],
+        [-0.4945977],
+        [0.47545704],
+        [2.28191],
+        [-1.4810909],
+        [0.3239962],
+        [2.215945],
+        [-1.284124],
+        [-0.29086646],
+        [-1.1755124],
+        [-0.4562066],
+        [-1.8371308],
+        [-1.1478351],
+        [-0.37523866],
+        [-1.9411281],
+        [-1.6829233],
+        [1.5801933],
+        [-1.763592],
+        [0.471502],
+        [-1.8385562],
+        [-1.6221057],
+        [-0.2342265],
+        [1.5579345],
+    ],
+    dtype=np.float32,
+)
+_BEAT_W_HH = np.array(
+    [
+        [0.21837276, -0.18894187, -1.377557, 0.02368363, 0.428687, -0.33761144, 0.20816484, -0.53279597],
+        [0.08806777, -0.07281633, -1.0372438, 0.01798264, 0.5992356, -0.14019994, 0.71158516, -0.30733213],
+        [-0.1914122, -0.35667768, 0.72911865, 0.05730215, -0.70578635, -0.37561318, 0.34918255, 1.4140136],
+        [-0.02710954, 0.08384288, -1.2162979, 0.2806858, 0.0313941, 0.04940996, 0.41427082, -0.3163139],
+        [-0.6059817, 0.7722626, -0.9891586, -0.6886831, 0.69048965, -0.2852175, -0.5994332, 0.2317115],
+        [0.24844006, -0.10947371, -1.2708198, 0.09581696, 0.7782825, -0.17305057, -0.41211772, -1.0803086],
+        [0.3273324, 0.07578273, -1.0008, 0.54624504, -0.06627015, 0.35076398, 0.5394633, 0.48873448],
+        [-0.6068607, 0.23890634, -0.37038577, -0.9960145, 0.49631986, -1.0374227, 0.0684825, 0.48175257],
+        [-1.0526305, 1.2339334, -0.03144038, -0.66427606, 0.24671665, -0.932715, -1.4414837, 2.1776178],
+        [-0.6819725, 0.21156597, -0.3578775, -0.5848043, 0.10369989, -0.0182352, -0.84986025, 1.3318975],
+        [-0.38235265, 0.7737251, -0.8743264, -1.3877537, 1.088845, -1.1460638, -1.5904802, -0.20761111],
+        [0.7470299, -0.1357011, 1.2817012, -0.36674356, 0.78291, 0.572283, -0.42792276, 0.21881399],
+        [-0.3608182, 0.8256266, -0.05957543, -1.1210523, 1.1693833, -0.24800867, -1.3036101, 0.04563542],
+        [-1.4204804, 1.3156079, 0.39886555, -1.2538626, -0.05922655, -1.2726437, -1.3260349, 1.6883177],
+        [0.36133656, -0.28713486, 0.3679666, 0.40583095, 0.5873029, 0.70440596, 0.09460878, -0.9911537],
+        [-0.62175137, 0.83324456, 0.3323098, -1.0844731, 1.2309693, -0.64856, -1.1452628, 0.06438428],
+        [0.06109472, -0.1794408, -0.91120374, 0.43881962, 0.6983807, 0.45872056, 0.53213686, -0.36537486],
+        [-0.01429755, 0.11511804, 1.2281008, -0.03711872, -0.18212391, -0.33510554, 0.08330284, 0.65482914],
+        [0.7881119, 0.5044115, 0.54973793, 0.00719606, 0.12785113, 0.09230851, -0.33757675, -0.94784606],
+        [-0.00435512, -0.43385676, -1.5128944, 0.39419138, -0.2159529, -0.13263425, 0.21967444, 0.05095883],
+        [-0.57904184, 0.11814177, -1.4495949, 0.21581346, -0.5324543, -0.40867063, 0.18473652, 0.01892551],
+        [0.55530596, -0.6954124, -0.90806216, 0.5894174, 0.21790019, 0.3712376, 0.29538184, -0.45083544],
+        [-0.24236497, -0.48168987, -1.0717871, 0.4513364, -0.5515471, 0.22251658, 0.00328223, 0.245705],
+        [0.46513963, -0.20012224, 1.5028826, -0.72579646, 0.733144, 0.61923957, 0.09090568, -0.08347078],
+    ],
+    dtype=np.float32,
+)
+_BEAT_B_IH = np.array(
+    [
+        0.22661082,
+        0.39329848,
+        0.53108484,
+        -0.11586303,
+        -0.3148793,
+        -0.13635144,
+        0.67471033,
+        -0.08181308,
+        -1.0490254,
+        -1.1522759,
+        -1.4128138,
+        -0.04944327,
+        -1.1883045,
+        -1.1550485,
+        -0.16908136,
+        -1.5636152,
+        0.246008,
+        -0.5016309,
+        0.43630338,
+        0.17391193,
+        0.58142823,
+        -0.04872124,
+        0.37669796,
+        -0.8089754,
+    ],
+    dtype=np.float32,
+)
+_BEAT_B_HH = np.array(
+    [
+        0.26528597,
+        0.22231632,
+        0.5749436,
+        0.19007114,
+        -0.05320328,
+        0.47610134,
+        0.4807601,
+        -0.03353593,
+        -0.67226356,
+        -1.544395,
+        -1.5849437,
+        -0.23120898,
+        -1.4601043,
+        -0.8977899,
+        -0.08579141,
+        -1.4269685,
+        0.30159336,
+        -0.41255045,
+        -0.25528878,
+        -0.01228876,
+        -0.09579726,
+        0.77717686,
+        0.5596912,
+        0.11125406,
+    ],
+    dtype=np.float32,
+)
+_BEAT_FC_W = np.array([[-1.3896451, 0.91180396, -1.4389762, -0.39588606, -0.7805852, -1.3019185, -0.51872027, 1.1329138]], dtype=np.float32)
+_BEAT_FC_B = np.array([-0.6675817], dtype=np.float32)
+# The visual EMA keeps 0.7 of the previous value per step at this step rate; other block
+# rates rescale the factor so the smoothing time constant (~23 ms) stays the same.
+_BEAT_EMA_KEEP = 0.7
+_BEAT_EMA_RATE = 120.0
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+    def _beat_gru_step(x, h, w_ih, b_ih, w_hh, b_hh, fc_w, fc_b):  # pragma: no cover - compiled
+        """One BeatNet step on a scalar input: updates the GRU state ``h`` in place, returns sigmoid(fc(h))."""
+        hidden = h.shape[0]
+        gh = np.empty(3 * hidden, dtype=np.float32)
+        for j in range(3 * hidden):
+            acc = b_hh[j]
+            for k in range(hidden):
+                acc += w_hh[j, k] * h[k]
+            gh[j] = acc
+        out = fc_b[0]
+        for j in range(hidden):
+            r = 1.0 / (1.0 + np.exp(-(w_ih[j, 0] * x + b_ih[j] + gh[j])))
+            z = 1.0 / (1.0 + np.exp(-(w_ih[hidden + j, 0] * x + b_ih[hidden + j] + gh[hidden + j])))
+            n = np.tanh(w_ih[2 * hidden + j, 0] * x + b_ih[2 * hidden + j] + r * gh[2 * hidden + j])
+            h[j] = (1.0 - z) * n + z * h[j]
+            out += fc_w[0, j] * h[j]
+        return 1.0 / (1.0 + np.exp(-out))
+
+else:
+    _beat_gru_step = None
+
+
 if TORCH_AVAILABLE:
 
     class BeatNet(nn.Module):
@@ -1191,177 +1618,215 @@ if TORCH_AVAILABLE:
             return y, hidden
 
 
-    class BeatDetectorRNN:
-        """Small GRU-based beat detector trained offline on synthetic pulses."""
+class BeatDetectorRNN:
+    """Small GRU-based beat detector trained offline on synthetic pulses.
 
-        def __init__(self, channels: int) -> None:
-            self.channels = channels
-            self.device = torch.device("cpu")
-            self.model = BeatNet().to(self.device)
-            self.model.eval()
-            self._load_weights()
+    The GRU step runs through a numba kernel when available, else ONNX Runtime, else TorchScript.
+    """
+
+    def __init__(self, channels: int, block_rate: float = _BEAT_EMA_RATE, onnx_path: Path | None = None) -> None:
+        self.channels = channels
+        self.visual_value = 0.0
+        self._ema_keep = _BEAT_EMA_KEEP ** (_BEAT_EMA_RATE / max(block_rate, 1.0))
+        self.model = None
+        self.session = None
+        self._use_kernel = False
+        self._x = np.zeros((1, 1, 1), dtype=np.float32)
+        self._h = np.zeros((1, 1, 8), dtype=np.float32)
+        if NUMBA_AVAILABLE:
+            try:
+                # Compile (or load from cache) before the audio thread needs it.
+                self._kernel_step(0.0)
+                self._use_kernel = True
+            except Exception as exc:  # pragma: no cover - depends on the numba/llvmlite install
+                logging.getLogger(__name__).warning("Numba GRU kernel unavailable: %s", exc)
+            self._h[...] = 0.0
+            if self._use_kernel:
+                return
+        if not TORCH_AVAILABLE:
+            raise RuntimeError("numba or PyTorch is required for BeatDetectorRNN.")
+        self.device = torch.device("cpu")
+        self.model = BeatNet().to(self.device)
+        self.model.eval()
+        self._load_weights()
+        # One scalar per step: intra-op threading only adds overhead.
+        torch.set_num_threads(1)
+        if ONNXRUNTIME_AVAILABLE and onnx_path is not None:
+            try:
+                self.session = self._create_onnx_session(onnx_path)
+            except Exception as exc:  # pragma: no cover - depends on the onnx/onnxruntime builds
+                logging.getLogger(__name__).warning("ONNX Runtime unavailable, using torch BeatNet: %s", exc)
+        # Shares memory with _x, so the torch path reuses one input buffer as well.
+        self._x_tensor = torch.from_numpy(self._x)
+        self.hidden = torch.zeros(1, 1, 8, dtype=torch.float32, device=self.device)
+        if self.session is not None:
+            return
+        try:
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {nn.GRU, nn.Linear}, dtype=torch.qint8
+            )
+        except Exception as exc:  # pragma: no cover - needs a quantized engine (fbgemm/qnnpack)
+            logging.getLogger(__name__).warning("Dynamic int8 quantization unavailable: %s", exc)
+        try:
+            self.model = torch.jit.optimize_for_inference(torch.jit.script(self.model))
+        except Exception as exc:  # pragma: no cover - depends on the torch build
+            logging.getLogger(__name__).warning("TorchScript unavailable, using eager BeatNet: %s", exc)
+
+    def reset(self) -> None:
+        if self.model is not None:
+            # Hidden states produced under inference_mode cannot be modified in place.
             self.hidden = torch.zeros(1, 1, 8, dtype=torch.float32, device=self.device)
-            self.visual_value = 0.0
-
-        def reset(self) -> None:
-            self.hidden.zero_()
-            self.visual_value = 0.0
-
-        def _load_weights(self) -> None:
-            with torch.no_grad():
-                self.model.gru.weight_ih_l0.copy_(
-                    torch.tensor(
-                        [
-                            [-1.148892],
-                            [-0.7618658],
-                            [-0.4945977],
-                            [0.47545704],
-                            [2.28191],
-                            [-1.4810909],
-                            [0.3239962],
-                            [2.215945],
-                            [-1.284124],
-                            [-0.29086646],
-                            [-1.1755124],
-                            [-0.4562066],
-                            [-1.8371308],
-                            [-1.1478351],
-                            [-0.37523866],
-                            [-1.9411281],
-                            [-1.6829233],
-                            [1.5801933],
-                            [-1.763592],
-                            [0.471502],
-                            [-1.8385562],
-                            [-1.6221057],
-                            [-0.2342265],
-                            [1.5579345],
-                        ],
-                        dtype=torch.float32,
-                    )
-                )
-                self.model.gru.weight_hh_l0.copy_(
-                    torch.tensor(
-                        [
-                            [0.21837276, -0.18894187, -1.377557, 0.02368363, 0.428687, -0.33761144, 0.20816484, -0.53279597],
-                            [0.08806777, -0.07281633, -1.0372438, 0.01798264, 0.5992356, -0.14019994, 0.71158516, -0.30733213],
-                            [-0.1914122, -0.35667768, 0.72911865, 0.05730215, -0.70578635, -0.37561318, 0.34918255, 1.4140136],
-                            [-0.02710954, 0.08384288, -1.2162979, 0.2806858, 0.0313941, 0.04940996, 0.41427082, -0.3163139],
-                            [-0.6059817, 0.7722626, -0.9891586, -0.6886831, 0.69048965, -0.2852175, -0.5994332, 0.2317115],
-                            [0.24844006, -0.10947371, -1.2708198, 0.09581696, 0.7782825, -0.17305057, -0.41211772, -1.0803086],
-                            [0.3273324, 0.07578273, -1.0008, 0.54624504, -0.06627015, 0.35076398, 0.5394633, 0.48873448],
-                            [-0.6068607, 0.23890634, -0.37038577, -0.9960145, 0.49631986, -1.0374227, 0.0684825, 0.48175257],
-                            [-1.0526305, 1.2339334, -0.03144038, -0.66427606, 0.24671665, -0.932715, -1.4414837, 2.1776178],
-                            [-0.6819725, 0.21156597, -0.3578775, -0.5848043, 0.10369989, -0.0182352, -0.84986025, 1.3318975],
-                            [-0.38235265, 0.7737251, -0.8743264, -1.3877537, 1.088845, -1.1460638, -1.5904802, -0.20761111],
-                            [0.7470299, -0.1357011, 1.2817012, -0.36674356, 0.78291, 0.572283, -0.42792276, 0.21881399],
-                            [-0.3608182, 0.8256266, -0.05957543, -1.1210523, 1.1693833, -0.24800867, -1.3036101, 0.04563542],
-                            [-1.4204804, 1.3156079, 0.39886555, -1.2538626, -0.05922655, -1.2726437, -1.3260349, 1.6883177],
-                            [0.36133656, -0.28713486, 0.3679666, 0.40583095, 0.5873029, 0.70440596, 0.09460878, -0.9911537],
-                            [-0.62175137, 0.83324456, 0.3323098, -1.0844731, 1.2309693, -0.64856, -1.1452628, 0.06438428],
-                            [0.06109472, -0.1794408, -0.91120374, 0.43881962, 0.6983807, 0.45872056, 0.53213686, -0.36537486],
-                            [-0.01429755, 0.11511804, 1.2281008, -0.03711872, -0.18212391, -0.33510554, 0.08330284, 0.65482914],
-                            [0.7881119, 0.5044115, 0.54973793, 0.00719606, 0.12785113, 0.09230851, -0.33757675, -0.94784606],
-                            [-0.00435512, -0.43385676, -1.5128944, 0.39419138, -0.2159529, -0.13263425, 0.21967444, 0.05095883],
-                            [-0.57904184, 0.11814177, -1.4495949, 0.21581346, -0.5324543, -0.40867063, 0.18473652, 0.01892551],
-                            [0.55530596, -0.6954124, -0.90806216, 0.5894174, 0.21790019, 0.3712376, 0.29538184, -0.45083544],
-                            [-0.24236497, -0.48168987, -1.0717871, 0.4513364, -0.5515471, 0.22251658, 0.00328223, 0.245705],
-                            [0.46513963, -0.20012224, 1.5028826, -0.72579646, 0.733144, 0.61923957, 0.09090568, -0.08347078],
-                        ],
-                        dtype=torch.float32,
-                    )
-                )
-                self.model.gru.bias_ih_l0.copy_(
-                    torch.tensor(
-                        [
-                            0.22661082,
-                            0.39329848,
-                            0.53108484,
-                            -0.11586303,
-                            -0.3148793,
-                            -0.13635144,
-                            0.67471033,
-                            -0.08181308,
-                            -1.0490254,
-                            -1.1522759,
-                            -1.4128138,
-                            -0.04944327,
-                            -1.1883045,
-                            -1.1550485,
-                            -0.16908136,
-                            -1.5636152,
-                            0.246008,
-                            -0.5016309,
-                            0.43630338,
-                            0.17391193,
-                            0.58142823,
-                            -0.04872124,
-                            0.37669796,
-                            -0.8089754,
-                        ],
-                        dtype=torch.float32,
-                    )
-                )
-                self.model.gru.bias_hh_l0.copy_(
-                    torch.tensor(
-                        [
-                            0.26528597,
-                            0.22231632,
-                            0.5749436,
-                            0.19007114,
-                            -0.05320328,
-                            0.47610134,
-                            0.4807601,
-                            -0.03353593,
-                            -0.67226356,
-                            -1.544395,
-                            -1.5849437,
-                            -0.23120898,
-                            -1.4601043,
-                            -0.8977899,
-                            -0.08579141,
-                            -1.4269685,
-                            0.30159336,
-                            -0.41255045,
-                            -0.25528878,
-                            -0.01228876,
-                            -0.09579726,
-                            0.77717686,
-                            0.5596912,
-                            0.11125406,
-                        ],
-                        dtype=torch.float32,
-                    )
-                )
-                self.model.fc.weight.copy_(
-                    torch.tensor(
-                        [[-1.3896451, 0.91180396, -1.4389762, -0.39588606, -0.7805852, -1.3019185, -0.51872027, 1.1329138]],
-                        dtype=torch.float32,
-                    )
-                )
-                self.model.fc.bias.copy_(torch.tensor([-0.6675817], dtype=torch.float32))
+        self._h = np.zeros((1, 1, 8), dtype=np.float32)
+        self.visual_value = 0.0
+
+    def _kernel_step(self, sample: float) -> float:
+        return _beat_gru_step(
+            np.float32(sample),
+            self._h[0, 0],
+            _BEAT_W_IH,
+            _BEAT_B_IH,
+            _BEAT_W_HH,
+            _BEAT_B_HH,
+            _BEAT_FC_W,
+            _BEAT_FC_B,
+        )
 
-        def process(self, rms_value: float) -> float:
-            sample = max(0.0, min(1.0, float(rms_value) * 4.0))
-            x = torch.tensor([[[sample]]], dtype=torch.float32, device=self.device)
-            with torch.no_grad():
-                output, hidden = self.model(x, self.hidden)
-            self.hidden = hidden.detach()
-            beat_prob = float(output[:, -1, :].cpu().item())
-            self.visual_value = 0.7 * self.visual_value + 0.3 * beat_prob
-            return self.visual_value
+    def _create_onnx_session(self, onnx_path: Path):
+        # The weights live in this file, so the export is stale whenever the source is newer.
+        if not onnx_path.exists() or onnx_path.stat().st_mtime < Path(__file__).stat().st_mtime:
+            self._export_onnx(onnx_path)
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        return ort.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+
+    def _export_onnx(self, onnx_path: Path) -> None:
+        args = (
+            torch.zeros(1, 1, 1, dtype=torch.float32),
+            torch.zeros(1, 1, 8, dtype=torch.float32),
+        )
+        kwargs = {"input_names": ["x", "h"], "output_names": ["y", "h_out"], "opset_version": 17}
+        tmp_path = onnx_path.with_suffix(onnx_path.suffix + ".tmp")
+        try:
+            torch.onnx.export(self.model, args, str(tmp_path), dynamo=False, **kwargs)
+        except TypeError:  # torch < 2.5 has no dynamo switch
+            torch.onnx.export(self.model, args, str(tmp_path), **kwargs)
+        os.replace(tmp_path, onnx_path)
+
+    def _load_weights(self) -> None:
+        with torch.no_grad():
+            self.model.gru.weight_ih_l0.copy_(torch.from_numpy(_BEAT_W_IH))
+            self.model.gru.weight_hh_l0.copy_(torch.from_numpy(_BEAT_W_HH))
+            self.model.gru.bias_ih_l0.copy_(torch.from_numpy(_BEAT_B_IH))
+            self.model.gru.bias_hh_l0.copy_(torch.from_numpy(_BEAT_B_HH))
+            self.model.fc.weight.copy_(torch.from_numpy(_BEAT_FC_W))
+            self.model.fc.bias.copy_(torch.from_numpy(_BEAT_FC_B))
+
+    def process(self, rms_value: float) -> float:
+        sample = max(0.0, min(1.0, float(rms_value) * 4.0))
+        if self._use_kernel:
+            beat_prob = float(self._kernel_step(sample))
+        elif self.session is not None:
+            self._x[0, 0, 0] = sample
+            output, self._h = self.session.run(None, {"x": self._x, "h": self._h})
+            beat_prob = float(output[0, -1, 0])
+        else:
+            self._x[0, 0, 0] = sample
+            with torch.inference_mode():
+                output, hidden = self.model(self._x_tensor, self.hidden)
+            self.hidden = hidden
+            beat_prob = float(output[0, -1, 0])
+        keep = self._ema_keep
+        self.visual_value = keep * self.visual_value + (1.0 - keep) * beat_prob
+        return self.visual_value
 
 
-else:
+def _norm(value: float, lo: float, hi: float) -> float:
+    """Position of ``value`` between the band limits, clamped to [0, 1]."""
+    span = hi - lo if hi > lo else 1e-6
+    return max(0.0, min(1.0, (value - lo) / span))
+
+
+@lru_cache(maxsize=128)
+def _hex_to_rgb(hex_color: str) -> int:
+    """Parse ``#rrggbb`` into a packed 0xRRGGBB integer."""
+    return int(hex_color.lstrip("#"), 16)
+
+
+def _build_srgb_tables() -> tuple[tuple[int, ...], bytes]:
+    """8-bit sRGB -> 12-bit linear light, and 12-bit linear -> 8-bit sRGB.
+
+    12 bits keep the dark end distinct: every sRGB byte survives the round trip unchanged.
+    """
+    srgb = np.arange(256) / 255.0
+    decoded = np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
+    linear = np.arange(4096) / 4095.0
+    encoded = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1.0 / 2.4) - 0.055)
+    to_linear = tuple(np.rint(decoded * 4095.0).astype(int).tolist())
+    to_srgb = bytes(np.rint(encoded * 255.0).astype(np.uint8))
+    return to_linear, to_srgb
+
+
+_S2L, _L2S = _build_srgb_tables()
+
 
-    class BeatDetectorRNN:
-        def __init__(self, channels: int) -> None:
-            raise RuntimeError("PyTorch is required for BeatDetectorRNN.")
+def _mix_rgb(start_rgb: int, end_rgb: int, t: float) -> str:
+    """Blend two packed colours in linear light with 8.8 fixed-point weights.
+
+    Mixing the sRGB bytes directly darkens the midtones (black/white gives #808080 instead of
+    #bcbcbc); the tables make the correct blend two lookups and a multiply-add per channel.
+    """
+    ti = int(round(t * 256))
+    inv = 256 - ti
+    s2l = _S2L
+    l2s = _L2S
+    r = l2s[(s2l[start_rgb >> 16] * inv + s2l[end_rgb >> 16] * ti + 128) >> 8]
+    g = l2s[(s2l[(start_rgb >> 8) & 0xFF] * inv + s2l[(end_rgb >> 8) & 0xFF] * ti + 128) >> 8]
+    b = l2s[(s2l[start_rgb & 0xFF] * inv + s2l[end_rgb & 0xFF] * ti + 128) >> 8]
+    return "#%02x%02x%02x" % (r, g, b)
+
+
+def _mix_hex(start_hex: str, end_hex: str, t: float) -> str:
+    t = max(0.0, min(1.0, t))
+    return _mix_rgb(_hex_to_rgb(start_hex), _hex_to_rgb(end_hex), t)
+
+
+@lru_cache(maxsize=4096)
+def _mix_hex_cached(start_hex: str, end_hex: str, q: int) -> str:
+    """Blend at one of 256 steps (q in 0..255); an 8-bit channel cannot resolve finer ``t``."""
+    return _mix_hex(start_hex, end_hex, q / 255)
+
+
+def _build_color_lut(start_rgb: int, end_rgb: int, size: int = 256) -> list[str]:
+    """Precompute the start->end blend so per-frame colouring is a list lookup."""
+    last = size - 1
+    return [_mix_rgb(start_rgb, end_rgb, i / last) for i in range(size)]
+
+
+@lru_cache(maxsize=8)
+def _catmull_rom_basis(steps: int) -> np.ndarray:
+    """(4, steps) weights mapping four control points to ``steps`` samples of one segment."""
+    t = np.arange(steps) / steps
+    t2 = t * t
+    t3 = t2 * t
+    basis = 0.5 * np.stack(
+        (
+            -t3 + 2.0 * t2 - t,
+            3.0 * t3 - 5.0 * t2 + 2.0,
+            -3.0 * t3 + 4.0 * t2 + t,
+            t3 - t2,
+        )
+    )
+    basis.flags.writeable = False
+    return basis
 
 
 class NeonWaveWindow(tk.Toplevel):
     """Cyberpunk-inspired neon waveform driven by RMS energy."""
 
+    # Catmull-Rom samples per history step; the history is ~3 px apart, so this is ~1 px.
+    spline_steps = 3
+
     def __init__(self, master: tk.Misc, title: str, get_limits, on_close) -> None:
         super().__init__(master)
         self.get_limits = get_limits
@@ -1382,189 +1847,193 @@ class NeonWaveWindow(tk.Toplevel):
         )
         self.canvas.pack(fill="both", expand=True)
         self.canvas.bind("<Configure>", self._on_resize)
+        # Per-frame updates go straight to the Tcl command, bypassing the Canvas wrappers'
+        # argument flattening and option parsing.
+        self._canvas_path = str(self.canvas)
+        self._tk_call = self.canvas.tk.call
 
         self._width = 900
         self._height = 420
         self._baseline = self._height * 0.7
         self._amplitude = self._height * 0.55
         self._history_len = 240
-        self._history: deque[float] = deque([0.0] * self._history_len, maxlen=self._history_len)
+        # Ring buffer of normalized levels; _history_head is the next write slot (= oldest sample).
+        self._history = np.zeros(self._history_len)
+        self._history_head = 0
+        self._rebuild_spline()
 
-        self.glow_line: int | None = None
         self.main_line: int | None = None
-        self.highlight_line: int | None = None
         self.baseline_line: int | None = None
         self.grid_items: list[int] = []
+        # Last coords and (width, fill) sent per line item; unchanged values skip the Tk call.
+        self._last_wave_coords: list[float] | None = None
+        self._line_styles: dict[int, tuple[float, str]] = {}
+        self._pending_size = (self._width, self._height)
+        self._resize_after_id: str | None = None
+        self._draw_after_id: str | None = None
+        # Size of the last applied layout. The constructor's baseline/amplitude are not the
+        # resize proportions, so the first <Configure> always lays out even at 900x420.
+        self._layout_size: tuple[int, int] | None = None
 
         self._draw_background()
         self.protocol("WM_DELETE_WINDOW", self._handle_close)
 
     def update_wave(self, rms_value: float, beat_level: float, dt: float) -> None:
-        min_val, max_val = self.get_limits()
-        if max_val <= min_val:
-            max_val = min_val + 1e-6
-        normalized = (float(rms_value) - min_val) / (max_val - min_val)
-        normalized = max(0.0, min(1.0, normalized))
+        normalized = _norm(float(rms_value), *self.get_limits())
 
         self._current_level = normalized
         self._last_beat = max(0.0, min(1.0, float(beat_level)))
-        self._history.append(normalized)
+        self._history[self._history_head] = normalized
+        self._history_head = (self._history_head + 1) % self._history_len
+        # Draw when Tk goes idle: updates arriving in the same event-loop pass share one set
+        # of canvas mutations, applied back to back right before Tk repaints.
+        if self._draw_after_id is None:
+            self._draw_after_id = self.after_idle(self._flush_wave)
+
+    def _flush_wave(self) -> None:
+        self._draw_after_id = None
         self._draw_wave()
 
     def _draw_background(self) -> None:
-        for item in self.grid_items:
-            self.canvas.delete(item)
-        self.grid_items.clear()
-
         rows = 6
         cols = 12
-        for i in range(1, rows):
+        if not self.grid_items:
+            # Created once; later calls (resizes) only move the existing items.
+            for _ in range(1, rows):
+                self.grid_items.append(self.canvas.create_line(0, 0, 0, 0, fill="#07102e", dash=(4, 10)))
+            for _ in range(1, cols):
+                self.grid_items.append(self.canvas.create_line(0, 0, 0, 0, fill="#050b1c", dash=(2, 12)))
+            self.baseline_line = self.canvas.create_line(0, 0, 0, 0, fill="#101a3c", width=2)
+
+        for i, item in enumerate(self.grid_items[: rows - 1], start=1):
             y = self._baseline - (self._amplitude * (i / rows))
-            if y < 0 or y > self._height:
-                continue
-            self.grid_items.append(
-                self.canvas.create_line(
-                    0,
-                    y,
-                    self._width,
-                    y,
-                    fill="#07102e",
-                    dash=(4, 10),
-                )
-            )
-        for i in range(1, cols):
+            self.canvas.coords(item, 0, y, self._width, y)
+        for i, item in enumerate(self.grid_items[rows - 1 :], start=1):
             x = self._width * (i / cols)
-            self.grid_items.append(
-                self.canvas.create_line(
-                    x,
-                    0,
-                    x,
-                    self._height,
-                    fill="#050b1c",
-                    dash=(2, 12),
-                )
-            )
-
-        if self.baseline_line is not None:
-            self.canvas.delete(self.baseline_line)
-        self.baseline_line = self.canvas.create_line(
-            0,
-            self._baseline,
-            self._width,
-            self._baseline,
-            fill="#101a3c",
-            width=2,
-        )
+            self.canvas.coords(item, x, 0, x, self._height)
+        self.canvas.coords(self.baseline_line, 0, self._baseline, self._width, self._baseline)
+
+    def _rebuild_spline(self) -> None:
+        """Size the spline buffers for the current history length and precompute the x samples.
+
+        The x grid only changes on resize, so the interleaved x0, y0, x1, y1, ... buffer gets its
+        x slots filled here once and _draw_wave only writes the y slots.
+        """
+        n = self._history_len
+        steps = self.spline_steps
+        self._basis = _catmull_rom_basis(steps)
+        # Control points with the end samples repeated, so the curve passes through every sample.
+        self._ctrl = np.empty(n + 2)
+        self._ctrl_windows = np.lib.stride_tricks.sliding_window_view(self._ctrl, 4)
+        self._dense = np.empty((n - 1, steps))
+        self._coords = np.empty(2 * ((n - 1) * steps + 1))
+        self._ctrl[1:-1] = np.linspace(0.0, self._width, n)
+        self._evaluate_spline(self._coords[0::2])
+
+    def _evaluate_spline(self, out: np.ndarray) -> None:
+        """Sample the curve through ``self._ctrl[1:-1]`` into ``out``."""
+        ctrl = self._ctrl
+        ctrl[0] = ctrl[1]
+        ctrl[-1] = ctrl[-2]
+        np.matmul(self._ctrl_windows, self._basis, out=self._dense)
+        out[:-1] = self._dense.ravel()
+        out[-1] = ctrl[-2]
 
     def _draw_wave(self) -> None:
-        if len(self._history) < 4:
-            return
-
-        samples = list(self._history)
-        count = len(samples)
-        step_x = self._width / max(1, count - 1)
-        coords: list[float] = []
-        for idx, value in enumerate(samples):
-            x = idx * step_x
-            y_offset = value * self._amplitude
-            y = self._baseline - y_offset
-            coords.extend([x, y])
-
-        line_width = 3.0 + 10.0 * self._current_level + 6.0 * self._last_beat
-        glow_width = max(line_width * 2.4, line_width + 6.0)
-        highlight_width = max(1.6, line_width * 0.45)
-
-        base_color = self._mix_color("#6400ff", "#45f7ff", self._current_level)
-        glow_color = self._mix_color(base_color, "#9afaff", min(1.0, 0.35 + 0.45 * self._last_beat))
-        highlight_color = self._mix_color(base_color, "#ffffff", min(1.0, 0.5 + 0.4 * self._last_beat))
-
-        if self.glow_line is None:
-            self.glow_line = self.canvas.create_line(
-                *coords,
-                smooth=True,
-                splinesteps=24,
-                fill=glow_color,
-                width=glow_width,
-                capstyle="round",
-            )
-        else:
-            self.canvas.coords(self.glow_line, *coords)
-            self.canvas.itemconfigure(self.glow_line, width=glow_width, fill=glow_color)
+        # Scale the history into the control points, oldest sample first. The ring is unrolled
+        # by writing its two halves into place, then the smoothed curve fills the y slots.
+        head = self._history_head
+        tail = self._history_len - head
+        ctrl = self._ctrl
+        np.multiply(self._history[head:], -self._amplitude, out=ctrl[1 : tail + 1])
+        np.multiply(self._history[:head], -self._amplitude, out=ctrl[tail + 1 : -1])
+        ctrl[1:-1] += self._baseline
+        self._evaluate_spline(self._coords[1::2])
+        coords = self._coords.tolist()
+        coords_changed = coords != self._last_wave_coords
+        self._last_wave_coords = coords
+
+        # Tenth-of-a-pixel widths are indistinguishable on screen and let steady frames match.
+        line_width = round(3.0 + 10.0 * self._current_level + 6.0 * self._last_beat, 1)
+
+        # A single line in a pre-blended colour stands in for the former glow/main/highlight
+        # stack. The points are already smoothed, so Tk draws a plain polyline.
+        # Level and beat are already clamped to [0, 1], so the blend factors stay in range.
+        base_color = _mix_hex_cached("#6400ff", "#45f7ff", int(round(self._current_level * 255)))
+        highlight_color = _mix_hex_cached(
+            base_color, "#ffffff", int(round(min(1.0, 0.5 + 0.4 * self._last_beat) * 255))
+        )
+        line_color = _mix_hex_cached(base_color, highlight_color, 64)
 
         if self.main_line is None:
             self.main_line = self.canvas.create_line(
                 *coords,
-                smooth=True,
-                splinesteps=36,
-                fill=base_color,
+                fill=line_color,
                 width=line_width,
                 capstyle="round",
             )
+            # The background items are only ever moved, never recreated, so stacking them
+            # under the wave once is enough.
+            if self.baseline_line is not None:
+                self.canvas.tag_lower(self.baseline_line, self.main_line)
+            for item in self.grid_items:
+                self.canvas.tag_lower(item, self.main_line)
         else:
-            self.canvas.coords(self.main_line, *coords)
-            self.canvas.itemconfigure(self.main_line, width=line_width, fill=base_color)
-
-        if self.highlight_line is None:
-            self.highlight_line = self.canvas.create_line(
-                *coords,
-                smooth=True,
-                splinesteps=24,
-                fill=highlight_color,
-                width=highlight_width,
-                capstyle="round",
-            )
-        else:
-            self.canvas.coords(self.highlight_line, *coords)
-            self.canvas.itemconfigure(self.highlight_line, width=highlight_width, fill=highlight_color)
+            if coords_changed:
+                # Tk's coords accepts the points as a single list argument.
+                self._tk_call(self._canvas_path, "coords", self.main_line, coords)
+            self._configure_line(self.main_line, line_width, line_color)
 
-        if self.baseline_line is not None:
-            self.canvas.tag_lower(self.baseline_line, self.glow_line)
-        for item in self.grid_items:
-            self.canvas.tag_lower(item, self.glow_line)
+    def _configure_line(self, item: int, width: float, fill: str) -> None:
+        style = (width, fill)
+        if self._line_styles.get(item) != style:
+            self._tk_call(self._canvas_path, "itemconfigure", item, "-width", width, "-fill", fill)
+            self._line_styles[item] = style
 
     def _on_resize(self, event) -> None:
-        self._width = max(360, int(event.width))
-        self._height = max(220, int(event.height))
+        # Dragging a window edge emits a burst of <Configure> events; lay out once it settles.
+        self._pending_size = (int(event.width), int(event.height))
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_after_id = None
+        width, height = self._pending_size
+        size = (max(360, width), max(220, height))
+        if size == self._layout_size:
+            return
+        self._layout_size = size
+        self._width, self._height = size
         self._baseline = self._height * 0.72
         self._amplitude = self._height * 0.6
         desired_len = max(120, min(480, int(self._width / 3)))
         if desired_len != self._history_len:
-            samples = list(self._history)
-            if desired_len > len(samples):
-                pad_value = samples[0] if samples else 0.0
-                pad = [pad_value] * (desired_len - len(samples))
-                samples = pad + samples
-            else:
-                samples = samples[-desired_len:]
+            # Keep the newest samples in order (oldest first); a longer buffer is padded at the
+            # old end with the oldest value so the wave does not jump.
+            samples = np.roll(self._history, -self._history_head)
+            keep = min(samples.size, desired_len)
+            history = np.empty(desired_len)
+            history[desired_len - keep :] = samples[-keep:]
+            history[: desired_len - keep] = samples[0]
             self._history_len = desired_len
-            self._history = deque(samples, maxlen=self._history_len)
+            self._history = history
+            self._history_head = 0
+        self._rebuild_spline()
         self._draw_background()
         self._draw_wave()
 
     def _handle_close(self) -> None:
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        if self._draw_after_id is not None:
+            self.after_cancel(self._draw_after_id)
+            self._draw_after_id = None
         if callable(self._on_close_callback):
             self._on_close_callback()
         self.destroy()
 
-    @staticmethod
-    def _mix_color(start_hex: str, end_hex: str, t: float) -> str:
-        t = max(0.0, min(1.0, t))
-
-        def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-            hex_color = hex_color.lstrip("#")
-            return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-
-        def rgb_to_hex(rgb: tuple[int, int, int]) -> str:
-            return "#%02x%02x%02x" % rgb
-
-        start_rgb = hex_to_rgb(start_hex)
-        end_rgb = hex_to_rgb(end_hex)
-        mixed = tuple(
-            int(round(start_rgb[i] + (end_rgb[i] - start_rgb[i]) * t))
-            for i in range(3)
-        )
-        return rgb_to_hex(mixed)
-
 
 class CircularRMSWindow(tk.Toplevel):
     def __init__(
@@ -1589,11 +2058,31 @@ class CircularRMSWindow(tk.Toplevel):
         self.high_target_color = "#fefefe"
         self.gradient_mode = bool(gradient_mode)
         self._on_close_callback = on_close
+        self._base_rgb = _hex_to_rgb(self.base_color)
+        self._target_rgb = _hex_to_rgb(self.target_color)
+        self._low_lut = _build_color_lut(self._base_rgb, self._target_rgb)
+        self._high_lut = _build_color_lut(
+            _hex_to_rgb(self.high_base_color), _hex_to_rgb(self.high_target_color)
+        )
         self._current_rms = 0.0
         self._current_high_rms = 0.0
         self._beat_visual = 0.0
         self._low_normalized = 0.0
         self._high_normalized = 0.0
+        # Last fill sent to each circle, so unchanged colours skip the Tk call.
+        self._last_low_color = self.base_color
+        self._last_high_color = self.high_base_color
+        # LUT step the circles were last coloured with; -1 forces the next recolour through.
+        self._last_mix_bucket = -1
+        self._last_low_coords: tuple[int, ...] | None = None
+        self._last_high_coords: tuple[int, ...] | None = None
+        # Level/beat updates only mark what changed; one timer redraws at most ~60 times a second.
+        self._geom_dirty = False
+        self._color_dirty = False
+        self._flush_after_id: str | None = None
+        self._resize_after_id: str | None = None
+        # Python-side copy of the checkbox, kept current by the trace, so redraws skip the Tcl read.
+        self._include_high = bool(self.include_high_var.get())
         self._include_high_trace = self.include_high_var.trace_add(
             "write", self._on_include_high_changed
         )
@@ -1608,9 +2097,13 @@ class CircularRMSWindow(tk.Toplevel):
 
         self.width = 900
         self.height = 900
+        self._pending_size = (self.width, self.height)
         self.low_circle = self.canvas.create_oval(0, 0, 0, 0, fill=self.base_color, outline="")
-        self.high_circle = self.canvas.create_oval(0, 0, 0, 0, fill=self.high_base_color, outline="")
-        self.canvas.itemconfigure(self.high_circle, state="hidden")
+        self.high_circle = self.canvas.create_oval(
+            0, 0, 0, 0, fill=self.high_base_color, outline="", state="hidden"
+        )
+        # Mirrors the high circle's Tk state so it is only reconfigured on show/hide transitions.
+        self._high_visible = False
         self.canvas.tag_raise(self.high_circle)
 
         self.protocol("WM_DELETE_WINDOW", self._handle_close)
@@ -1619,70 +2112,104 @@ class CircularRMSWindow(tk.Toplevel):
         self._current_rms = float(low_rms)
         if high_rms is not None:
             self._current_high_rms = float(high_rms)
-        self._redraw_circles()
+        self._geom_dirty = True
+        self._schedule_flush()
 
     def update_beat(self, probability: float) -> None:
         probability = max(0.0, min(1.0, probability))
         self._beat_visual = 0.6 * self._beat_visual + 0.4 * probability
-        self._update_colors()
+        self._color_dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self, delay_ms: int = 16) -> None:
+        if self._flush_after_id is None:
+            self._flush_after_id = self.after(delay_ms, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_after_id = None
+        if self._geom_dirty:
+            # _redraw_circles recolours as well.
+            self._redraw_circles()
+        elif self._color_dirty:
+            self._update_colors()
+        self._geom_dirty = False
+        self._color_dirty = False
 
     def _on_resize(self, event) -> None:
-        self.width = max(100, int(event.width))
-        self.height = max(100, int(event.height))
+        self._pending_size = (int(event.width), int(event.height))
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_after_id = None
+        width, height = self._pending_size
+        width = max(100, width)
+        height = max(100, height)
+        if width == self.width and height == self.height:
+            return
+        self.width = width
+        self.height = height
         self._redraw_circles()
 
     def _redraw_circles(self) -> None:
-        cx = self.width / 2
-        cy = self.height / 2
+        cx = self.width // 2
+        cy = self.height // 2
         span = min(self.width, self.height) / 2.0
 
-        min_val, max_val = self.get_limits()
-        if max_val <= min_val:
-            max_val = min_val + 1e-6
-        normalized = (self._current_rms - min_val) / (max_val - min_val)
-        normalized = max(0.0, min(1.0, normalized))
-        radius = span * normalized
-        if radius <= 0.0:
-            low_coords = (cx, cy, cx, cy)
-        else:
-            low_coords = (cx - radius, cy - radius, cx + radius, cy + radius)
-        self.canvas.coords(self.low_circle, *low_coords)
+        normalized = _norm(self._current_rms, *self.get_limits())
+        # Whole-pixel radii: sub-pixel changes would not move the oval on screen anyway.
+        radius = int(round(span * normalized))
+        low_coords = (cx - radius, cy - radius, cx + radius, cy + radius)
+        if low_coords != self._last_low_coords:
+            self.canvas.coords(self.low_circle, *low_coords)
+            self._last_low_coords = low_coords
         self._low_normalized = normalized
 
-        if self.include_high_var.get():
-            high_min, high_max = self.get_high_band_limits()
-            if high_max <= high_min:
-                high_max = high_min + 1e-6
-            high_norm = (self._current_high_rms - high_min) / (high_max - high_min)
-            high_norm = max(0.0, min(1.0, high_norm))
-            high_radius = span * high_norm
-            if high_radius <= 0.0:
-                high_coords = (cx, cy, cx, cy)
-            else:
-                high_coords = (cx - high_radius, cy - high_radius, cx + high_radius, cy + high_radius)
-            self.canvas.coords(self.high_circle, *high_coords)
-            self.canvas.itemconfigure(self.high_circle, state="normal")
+        if self._include_high:
+            high_norm = _norm(self._current_high_rms, *self.get_high_band_limits())
+            high_radius = int(round(span * high_norm))
+            high_coords = (cx - high_radius, cy - high_radius, cx + high_radius, cy + high_radius)
+            if high_coords != self._last_high_coords:
+                self.canvas.coords(self.high_circle, *high_coords)
+                self._last_high_coords = high_coords
             self._high_normalized = high_norm
+            self._set_high_visible(True)
         else:
-            self.canvas.itemconfigure(self.high_circle, state="hidden")
             self._high_normalized = 0.0
+            self._set_high_visible(False)
 
         self._update_colors()
 
     def _update_colors(self) -> None:
         beat_mix = max(0.0, min(1.0, self._beat_visual))
         gradient_mix = max(0.0, min(1.0, self._low_normalized if self.gradient_mode else 0.0))
-        mix = max(beat_mix, gradient_mix)
-        low_color = BandWindow._mix_color(self.base_color, self.target_color, mix)
-        self.canvas.itemconfigure(self.low_circle, fill=low_color)
-        if self.include_high_var.get():
-            high_color = BandWindow._mix_color(self.high_base_color, self.high_target_color, mix)
-            self.canvas.itemconfigure(self.high_circle, fill=high_color, state="normal")
+        lut_idx = int(round(max(beat_mix, gradient_mix) * 255))
+        if lut_idx == self._last_mix_bucket:
+            return
+        self._last_mix_bucket = lut_idx
+        low_color = self._low_lut[lut_idx]
+        if low_color != self._last_low_color:
+            self.canvas.itemconfigure(self.low_circle, fill=low_color)
+            self._last_low_color = low_color
+        if self._include_high:
+            high_color = self._high_lut[lut_idx]
+            if high_color != self._last_high_color:
+                self.canvas.itemconfigure(self.high_circle, fill=high_color)
+                self._last_high_color = high_color
         else:
-            self.canvas.itemconfigure(self.high_circle, state="hidden")
+            self._set_high_visible(False)
+
+    def _set_high_visible(self, visible: bool) -> None:
+        if visible != self._high_visible:
+            self.canvas.itemconfigure(self.high_circle, state="normal" if visible else "hidden")
+            self._high_visible = visible
 
     def set_base_color(self, color: str) -> None:
         self.base_color = color
+        self._base_rgb = _hex_to_rgb(color)
+        self._low_lut = _build_color_lut(self._base_rgb, self._target_rgb)
+        self._last_mix_bucket = -1
         self._update_colors()
 
     def set_gradient_mode(self, enabled: bool) -> None:
@@ -1690,9 +2217,19 @@ class CircularRMSWindow(tk.Toplevel):
         self._update_colors()
 
     def _on_include_high_changed(self, *_args) -> None:
-        self._redraw_circles()
+        self._include_high = bool(self.include_high_var.get())
+        # The high circle's fill is not kept current while it is hidden.
+        self._last_mix_bucket = -1
+        self._geom_dirty = True
+        self._schedule_flush()
 
     def _handle_close(self) -> None:
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
         if self._include_high_trace is not None:
             try:
                 self.include_high_var.trace_remove("write", self._include_high_trace)
@@ -1711,19 +2248,25 @@ class BandWindow(tk.Toplevel):
         self,
         master: tk.Misc,
         title: str,
-        rms_to_db,
-        get_limits,
-        set_limits,
+        band_index: int,
+        levels: np.ndarray,
+        mins: np.ndarray,
+        maxs: np.ndarray,
         base_color: str,
         gradient_mode: bool,
         on_close,
     ) -> None:
         super().__init__(master)
-        self.rms_to_db = rms_to_db
-        self.get_limits = get_limits
-        self.set_limits = set_limits
+        # Views of the app's per-band arrays; the window reads its own slot each frame.
+        self.band_index = band_index
+        self._levels = levels
+        self._mins = mins
+        self._maxs = maxs
         self.base_color = base_color
         self.target_color = "#f8f8f8"
+        self._base_rgb = _hex_to_rgb(self.base_color)
+        self._target_rgb = _hex_to_rgb(self.target_color)
+        self._color_lut = _build_color_lut(self._base_rgb, self._target_rgb)
         self.gradient_mode = bool(gradient_mode)
         self._on_close_callback = on_close
 
@@ -1745,6 +2288,8 @@ class BandWindow(tk.Toplevel):
         self.canvas.pack(padx=0, pady=0, fill="both", expand=True)
 
         self.canvas.bind("<Configure>", self._on_canvas_resize)
+        self._canvas_path = str(self.canvas)
+        self._tk_call = self.canvas.tk.call
         self.canvas_width = self.min_canvas_width
         self.canvas_height = self.min_canvas_height
         self.geometry("100x900")
@@ -1776,24 +2321,45 @@ class BandWindow(tk.Toplevel):
         self._beat_visual = 0.0
         self._current_rms = 0.0
         self._current_normalized = 0.0
+        self._last_bar_coords: tuple[float, ...] | None = None
+        self._last_bar_fill = self.base_color
+        self._last_mix_bucket = -1
+        self._geom_dirty = False
+        self._color_dirty = False
+        self._flush_after_id: str | None = None
+        self._pending_size = (self.canvas_width, self.canvas_height)
+        self._resize_after_id: str | None = None
         self._update_bar_color()
 
-    def update_level(self, rms_value: float) -> None:
-        self._current_rms = float(rms_value)
-        self._redraw_bar()
-        self._update_bar_color()
+    def update_level(self) -> None:
+        self._current_rms = float(self._levels[self.band_index])
+        self._geom_dirty = True
+        self._schedule_flush()
 
     def update_beat(self, probability: float) -> None:
         probability = max(0.0, min(1.0, probability))
         self._beat_visual = 0.6 * self._beat_visual + 0.4 * probability
-        self._update_bar_color()
+        self._color_dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self, delay_ms: int = 16) -> None:
+        """Coalesce level and beat updates into one redraw, capped at ~60 Hz."""
+        if self._flush_after_id is None:
+            self._flush_after_id = self.after(delay_ms, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_after_id = None
+        if self._geom_dirty:
+            self._redraw_bar()
+        if self._geom_dirty or self._color_dirty:
+            # The gradient colour follows the bar height, so a geometry change recolours too.
+            self._update_bar_color()
+        self._geom_dirty = False
+        self._color_dirty = False
 
     def _redraw_bar(self) -> None:
-        min_val, max_val = self.get_limits()
-        if max_val <= min_val:
-            max_val = min_val + 1e-6
-        normalized = (self._current_rms - min_val) / (max_val - min_val)
-        normalized = max(0.0, min(1.0, normalized))
+        idx = self.band_index
+        normalized = _norm(self._current_rms, float(self._mins[idx]), float(self._maxs[idx]))
         if normalized <= 0.0:
             y_top = self.center_y
             y_bottom = self.center_y
@@ -1802,7 +2368,11 @@ class BandWindow(tk.Toplevel):
             half_span = max(half_span, 0.5)
             y_top = max(0.0, self.center_y - half_span)
             y_bottom = min(self.canvas_height, self.center_y + half_span)
-        self.canvas.coords(self.bar, 0, y_top, self.canvas_width, y_bottom)
+        # Snap outward to whole pixels and skip the Tk call when the bar would not move.
+        bar_coords = (0, math.floor(y_top), self.canvas_width, math.ceil(y_bottom))
+        if bar_coords != self._last_bar_coords:
+            self._tk_call(self._canvas_path, "coords", self.bar, *bar_coords)
+            self._last_bar_coords = bar_coords
         self._current_normalized = normalized
 
     def _update_bar_color(self) -> None:
@@ -1812,8 +2382,14 @@ class BandWindow(tk.Toplevel):
             mix = max(beat_mix, gradient_mix)
         else:
             mix = beat_mix
-        bar_color = self._mix_color(self.base_color, self.target_color, mix)
-        self.canvas.itemconfigure(self.bar, fill=bar_color)
+        bucket = int(round(mix * 255))
+        if bucket == self._last_mix_bucket:
+            return
+        self._last_mix_bucket = bucket
+        bar_color = self._color_lut[bucket]
+        if bar_color != self._last_bar_fill:
+            self.canvas.itemconfigure(self.bar, fill=bar_color)
+            self._last_bar_fill = bar_color
 
     def _apply_limits(self) -> None:
         pass
@@ -1822,18 +2398,33 @@ class BandWindow(tk.Toplevel):
         self._apply_limits()
 
     def _on_canvas_resize(self, event) -> None:
-        new_width = max(self.min_canvas_width, min(self.max_canvas_width, int(event.width)))
-        new_height = max(self.min_canvas_height, int(event.height))
+        self._pending_size = (int(event.width), int(event.height))
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_after_id = None
+        width, height = self._pending_size
+        new_width = max(self.min_canvas_width, min(self.max_canvas_width, width))
+        new_height = max(self.min_canvas_height, height)
+        if new_width == self.canvas_width and new_height == self.canvas_height:
+            return
         self.canvas_width = new_width
         self.canvas_height = new_height
         self.center_y = self.canvas_height / 2
-        self.canvas.coords(self.mid_line, 0, self.center_y, self.canvas_width, self.center_y)
-        self.canvas.coords(self.border_rect, 0, 0, self.canvas_width, self.canvas_height)
+        # Both items span the full width and height, so any size change moves both of them.
+        tk_call, path = self._tk_call, self._canvas_path
+        tk_call(path, "coords", self.mid_line, 0, self.center_y, new_width, self.center_y)
+        tk_call(path, "coords", self.border_rect, 0, 0, new_width, new_height)
         self._redraw_bar()
         self._update_bar_color()
 
     def set_base_color(self, new_color: str) -> None:
         self.base_color = new_color
+        self._base_rgb = _hex_to_rgb(new_color)
+        self._color_lut = _build_color_lut(self._base_rgb, self._target_rgb)
+        self._last_mix_bucket = -1
         self._update_bar_color()
 
     def set_gradient_mode(self, enabled: bool) -> None:
@@ -1841,38 +2432,36 @@ class BandWindow(tk.Toplevel):
         self._update_bar_color()
 
     def _handle_close(self) -> None:
+        if self._resize_after_id is not None:
+            self.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
         if callable(self._on_close_callback):
             self._on_close_callback()
         self.destroy()
 
-    @staticmethod
-    def _mix_color(start_hex: str, end_hex: str, t: float) -> str:
-        def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-            hex_color = hex_color.lstrip("#")
-            return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-
-        def rgb_to_hex(rgb: tuple[int, int, int]) -> str:
-            return "#%02x%02x%02x" % rgb
-
-        start_rgb = hex_to_rgb(start_hex)
-        end_rgb = hex_to_rgb(end_hex)
-        mixed = tuple(
-            int(round(start_rgb[i] + (end_rgb[i] - start_rgb[i]) * t))
-            for i in range(3)
-        )
-        return rgb_to_hex(mixed)
-
 
 def main() -> None:
     log_path = Path(__file__).with_name("loopback_monitor.log")
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.FileHandler(log_path, encoding="utf-8"),
-            logging.StreamHandler(sys.stdout),
-        ],
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    # Records are only queued by the logging call; file and console writes happen on the
+    # listener thread, so the audio callback and Tk loop never wait on disk or stdout.
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    listener.start()
+    atexit.register(listener.stop)
+    # The queue handler gets no formatter of its own; the listener's handlers do the formatting.
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     logging.getLogger(__name__).info("Application starting. Log: %s", log_path)
 
     root = tk.Tk()